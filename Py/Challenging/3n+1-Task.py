@@ -20,6 +20,7 @@ from tabulate import tabulate
 import numpy as np
 import matplotlib.pyplot as plt
 import random
+from profiler import phase, timed # Optional timing hooks, run with COLLATZ_PROFILE=1 to get a profile report at exit
 
 # DEFINING THE FUNCTIONS
 def rannum(): 
@@ -40,6 +41,7 @@ def odd(x):  # Define the actions if the value is odd
     array.append(x)  # Add new number to the array
     return x  # Return the new number
 
+@timed("stop-time search")
 def findStopTime(array): # Finds the stopping time of the array
     global stoppingtime # Define the global variable for stoppingtime
     stoppingtime = 0 # Define the global variable as 0 to start, this is needed because otherwise the value will be "None" if no stoppingtime is found
@@ -83,27 +85,35 @@ while run == 1:  # This is the loop that keeps the program running.
 
         count = 0  # global variable
 
-        while n > 1:  # Does not run the formula if the defined number is less than 2.
-            evenOdd(n) # See above description
-            n = array[-1] # Defines the new variable n as the last number in the array.
+        with phase("iteration"): # Times the 3n+1 arithmetic for this number.
+            while n > 1:  # Does not run the formula if the defined number is less than 2.
+                evenOdd(n) # See above description
+                n = array[-1] # Defines the new variable n as the last number in the array.
 
         findStopTime(array) # See above description
-        highnum = max(array) # Finds the highest number in the array.
-        data = [[ornum, highnum,  stoppingtime, len(array)-1]] # Creates a list that will be used to store the data that will be printed as a table at the end of the program.
+        with phase("max"):
+            highnum = max(array) # Finds the highest number in the array.
+        with phase("table building"):
+            data = [[ornum, highnum,  stoppingtime, len(array)-1]] # Creates a list that will be used to store the data that will be printed as a table at the end of the program.
+            datas.append(data[0]) # Adds the table data to the existing array that will be printed at the end.
         # Plotting Graph
-        x = np.arange(0, len(array)) # Defines the x axis of the graph as steps taken during the program.
-        y = np.array(array) # Defines the y axis of the graph as the numbers that are tested.
-        plt.title("Collatz Conjecture For Number " + str(ornum)) # Title of the graph.
-        plt.xlabel("Steps") # Label of the x axis.
-        plt.ylabel("Numbers") # Label of the y axis.
-        plt.plot(x, y, ranhex()) # Plots the graph.
-        plt.draw() # Draws the graph.
-        datas.append(data[0]) # Adds the table data to the existing array that will be printed at the end.
-        print (array) # Prints the array of numbers that were tested. (This can be commented out to increase calculation speed its simpliy so the user can see the numbers being tested) 
-
-    print('') # Create padding
-    print('') # Create padding
-    print(tabulate(datas, headers=["Orginal Number", "Highest Number", "stopping Time", "Total stopping Time"])) # Prints the table of all data for orginal number, highest number, stopping time and total stopping time
-    print('')# Create padding
-    print('')# Create padding
+        with phase("plotting"):
+            x = np.arange(0, len(array)) # Defines the x axis of the graph as steps taken during the program.
+            y = np.array(array) # Defines the y axis of the graph as the numbers that are tested.
+            plt.title("Collatz Conjecture For Number " + str(ornum)) # Title of the graph.
+            plt.xlabel("Steps") # Label of the x axis.
+            plt.ylabel("Numbers") # Label of the y axis.
+            plt.plot(x, y, ranhex()) # Plots the graph.
+            plt.draw() # Draws the graph.
+        with phase("printing"):
+            print (array) # Prints the array of numbers that were tested. (This can be commented out to increase calculation speed its simpliy so the user can see the numbers being tested) 
+
+    with phase("table building"):
+        table = tabulate(datas, headers=["Orginal Number", "Highest Number", "stopping Time", "Total stopping Time"]) # Builds the table of all data for orginal number, highest number, stopping time and total stopping time
+    with phase("printing"):
+        print('') # Create padding
+        print('') # Create padding
+        print(table) # Prints the table
+        print('')# Create padding
+        print('')# Create padding
     plt.show() # Displays the interactive grapgh to the user 
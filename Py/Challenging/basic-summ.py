@@ -1,17 +1,20 @@
 import numpy as np
 import statistics
 import math
+import sys
+from series import basicSum, basicTerms, trace  # Closed form sums, see series.py
+from summ_batch import batchFromArgs  # python basic-summ.py --batch questions.txt answers many at once
+
+if batchFromArgs(1):
+    sys.exit()
+traceMode = "--trace" in sys.argv  # python basic-summ.py --trace prints every term like the old loop did.
 run = 1
 
 while run == 1:
     i = int(input("Start Value? >>>"))
     k = int(input("Number Of Loops >>>"))
-    out2 = 0
-
-    for i in range(i, k+1):
-        x = i
-        out = x
-        print(out)
-
-        out2 = out2 + out
+    if traceMode:
+        out2 = trace(basicTerms(i, k))
+    else:
+        out2 = basicSum(i, k)
     print('Output =', out2)
@@ -0,0 +1,49 @@
+# Run: python bench_factorial.py
+# Description: Times the shared binary splitting factorial (factorial.py) against math.factorial and the
+# one-at-a-time loop that ptri.py and ptri-all.py used to define.
+
+import math
+import time
+
+import factorial
+
+
+def loopFactorial(a):  # The original factorial from ptri.py.
+    Prod = 1
+    for j in range(1, a+1):
+        Prod = j*Prod
+    return Prod
+
+
+def best(func, a, repeat=3):  # Fastest of a few runs, in seconds.
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(a)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def cold(a):  # Binary splitting with no checkpoints to start from.
+    factorial.clearCheckpoints()
+    return factorial.factorial(a)
+
+
+def fromCheckpoint(a):  # Binary splitting starting from a checkpoint at 90% of a.
+    factorial.clearCheckpoints()
+    factorial.factorial(a * 9 // 10)
+    start = time.perf_counter()
+    factorial.factorial(a)
+    return time.perf_counter() - start
+
+
+sizes = [1000, 10000, 50000, 100000, 200000]
+
+print('%10s %14s %14s %14s %16s' % ("n", "loop (s)", "math (s)", "split (s)", "checkpoint (s)"))
+for a in sizes:
+    assert cold(a) == math.factorial(a)
+    loopTime = best(loopFactorial, a, 1) if a <= 100000 else float("nan")  # The loop gets too slow past this.
+    mathTime = best(math.factorial, a)
+    splitTime = best(cold, a)
+    checkpointTime = min(fromCheckpoint(a) for _ in range(3))
+    print('%10d %14.6f %14.6f %14.6f %16.6f' % (a, loopTime, mathTime, splitTime, checkpointTime))
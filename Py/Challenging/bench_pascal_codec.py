@@ -0,0 +1,52 @@
+# Run: python bench_pascal_codec.py
+# Description: Compares the size and speed of the ways ptri-all.py can write rows: decimal text, the fixed
+# header binary format (pascal_io.py) and the compact varint and delta formats (pascal_codec.py).
+
+import io
+import sys
+import time
+
+import pascal
+import pascal_io
+
+if hasattr(sys, "set_int_max_str_digits"):
+    sys.set_int_max_str_digits(0)
+
+
+def timed(func, repeat=3):  # Fastest of a few runs, and what the last run returned.
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best, result
+
+
+def writeAll(fmt, rows):
+    sink = io.BytesIO()
+    writer = pascal_io.RowWriter(sink, fmt)
+    for r in rows:
+        writer.write(r)
+    writer.close()
+    return sink.getvalue()
+
+
+def readText(data):
+    return [[int(value) for value in line[1:-1].split(b", ")] for line in data.splitlines()]
+
+
+def readBinary(data):
+    return list(pascal_io.readRows(io.BytesIO(data)))
+
+
+print('%8s %8s %14s %12s %12s %8s' % ("rows", "format", "size (bytes)", "write (s)", "read (s)", "ratio"))
+for top in [200, 1000, 2000]:
+    rows = [r.copy() for r in pascal.rowStream(top)]
+    textSize = None
+    for fmt in ("text", "binary", "varint", "delta"):
+        writeTime, data = timed(lambda: writeAll(fmt, rows))
+        readTime, back = timed(lambda: readText(data) if fmt == "text" else readBinary(data), 1)
+        assert back == rows
+        textSize = textSize or len(data)
+        print('%8d %8s %14d %12.4f %12.4f %8.2f' % (top + 1, fmt, len(data), writeTime, readTime, textSize / len(data)))
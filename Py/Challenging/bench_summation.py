@@ -0,0 +1,44 @@
+# Run: python bench_summation.py
+# Description: Times every float summation mode in series_float.py and shows how far each answer is from the
+# exact sum, for series where adding one term at a time is known to drift.
+
+import math
+import time
+from fractions import Fraction
+
+from series_float import SUMS, exactTotal
+
+
+def harmonic(n):  # 1 + 1/2 + ... + 1/n, small terms added onto a growing total.
+    return [1.0 / x for x in range(1, n + 1)]
+
+
+def tenths(n):  # 0.1 added n times, a term that isn't exact in binary.
+    return [0.1] * n
+
+
+def alternating(n):  # 1 - 1/2 + 1/3 - ..., terms that mostly cancel.
+    return [(1.0 if x % 2 else -1.0) / x for x in range(1, n + 1)]
+
+
+def timed(func, values):
+    start = time.perf_counter()
+    result = func(values)
+    return result, time.perf_counter() - start
+
+
+def ulps(value, exact):  # Distance from the exact answer in units of the last place.
+    return float(abs(Fraction(value) - exact) / Fraction(math.ulp(float(exact))))
+
+
+series = [("harmonic", harmonic), ("0.1 repeated", tenths), ("alternating harmonic", alternating)]
+
+for name, make in series:
+    for n in [10 ** 5, 10 ** 6]:
+        values = make(n)
+        exact = exactTotal(values)
+        print(name, "n =", n)
+        for mode, func in SUMS.items():
+            result, seconds = timed(func, values)
+            print("  {:<9} {:>9.4f}s  {:.17g}  error {:.1f} ulp".format(mode, seconds, result, ulps(result, exact)))
+        print()
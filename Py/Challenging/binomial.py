@@ -0,0 +1,59 @@
+# Fast single entry of Pascal's triangle, C(n,k), for n in the millions.
+# Instead of dividing huge factorials, C(n,k) is built from its prime factorization: Legendre's formula gives the
+# power of each prime p in n! as n//p + n//p^2 + ..., so the power in C(n,k) is that of n! minus k! and (n-k)!.
+# The prime powers are then multiplied together with a balanced product tree, which keeps both sides of every
+# multiplication about the same size so Python's fast big number multiplication does the heavy lifting.
+
+import math
+from bisect import bisect_right
+
+from factorial import product  # Balanced product tree shared with factorial.py
+
+sieve = bytearray(b"\x00\x00")  # sieve[i] is 1 when i is prime, grown as bigger n are asked for.
+primeList = []
+
+
+def primesUpTo(n):  # Returns the list of primes <= n, only sieving again when n is bigger than before.
+    global sieve, primeList
+    if n >= len(sieve):
+        size = max(n + 1, 2 * len(sieve))
+        sieve = bytearray([1]) * size
+        sieve[0] = sieve[1] = 0
+        for i in range(2, math.isqrt(size - 1) + 1):
+            if sieve[i]:
+                sieve[i * i::i] = bytes(len(range(i * i, size, i)))
+        primeList = [i for i in range(size) if sieve[i]]
+    if primeList and primeList[-1] <= n:
+        return primeList
+    return primeList[:bisect_right(primeList, n)]
+
+
+def legendre(n, p):  # Power of the prime p in n!.
+    total = 0
+    while n:
+        n = n // p
+        total = total + n
+    return total
+
+
+def factorization(n, k):  # Returns [(prime, power), ...] for C(n,k), leaving out primes with power 0.
+    if k < 0 or k > n:
+        raise ValueError("C(n,k) needs 0 <= k <= n, got n=" + str(n) + " k=" + str(k))
+    k = min(k, n - k)
+    factors = []
+    for p in primesUpTo(n):
+        if p > n - k:  # Every prime between n-k and n divides n!/(n-k)! exactly once and nothing below cancels it.
+            power = 1
+        else:
+            power = legendre(n, p) - legendre(k, p) - legendre(n - k, p)
+        if power:
+            factors.append((p, power))
+    return factors
+
+
+def binomial(n, k):  # Exact C(n,k), 0 when k is outside the row.
+    if k < 0 or k > n:
+        return 0
+    if min(k, n - k) < 64:  # Tiny k is quicker with the simple running product.
+        return math.comb(n, k)
+    return product([p ** power if power > 1 else p for p, power in factorization(n, k)])
@@ -0,0 +1,23 @@
+# Shared Collatz Conjecture (3n+1) helpers.
+# If the number is even divide it by 2. If it's odd, multiply it by 3 and add 1. Repeat until you reach 1.
+
+
+def summary(n):  # Returns (original number, highest number, times checked) exactly as 3n+1.py prints them.
+    if n < 1:  # 0 and negative numbers never reach 1, so refuse them instead of looping forever.
+        raise ValueError("Collatz summary needs a number of at least 1, got " + str(n))
+    ornum = n
+    highnum = n
+    runtimes = 0
+    while n != 1:
+        if n % 2 == 0:
+            n = n // 2  # Integer division keeps huge numbers exact (3n+1.py uses n/2 which turns them into floats).
+        else:
+            n = (3 * n) + 1
+        runtimes = runtimes + 1
+        if n > highnum:
+            highnum = n
+    return ornum, highnum, runtimes + 1  # 3n+1.py counts the final check of 1 as well.
+
+
+def summaries(numbers):  # Runs summary() for a list of numbers, used to hand a whole batch to a worker process at once.
+    return [summary(n) for n in numbers]
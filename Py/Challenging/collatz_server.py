@@ -0,0 +1,235 @@
+# Run: python collatz_server.py --port 8031 --cache-size 100000 --workers 4
+# Description: A small local HTTP/JSON service that answers Collatz Conjecture questions for other tools.
+# Each answer is the same summary 3n+1.py prints: the original number, the highest number reached and the times checked.
+#
+# Endpoints:
+#   GET  /summary?n=27                -> {"original": 27, "highest": 9232, "checked": 112}
+#   GET  /batch?n=3,7,27              -> {"results": [...]}
+#   POST /batch  {"numbers": [3, 7]}  -> {"results": [...]}
+#   GET  /stats                       -> cache hits, misses and size
+#
+# Requests are handled concurrently with asyncio, the actual 3n+1 arithmetic runs in a process pool so a long
+# chain never blocks the other connections, and answers are kept in an LRU cache of configurable size.
+
+import argparse
+import asyncio
+import json
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+
+import collatz
+
+MAX_BODY = 1 << 20  # Largest request body accepted (1 MiB), batches bigger than this should be split by the caller.
+MAX_BATCH = 10000  # Largest number of values accepted in one batch request.
+MAX_LINE = 1 << 20  # Longest request line or header, enough for a GET /batch of MAX_BATCH long numbers.
+CHUNK = 256  # How many cache misses are sent to a worker process in one go.
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+           414: "URI Too Long", 431: "Request Header Fields Too Large", 500: "Internal Server Error"}
+
+
+class LRUCache:  # Keeps the most recently used answers, dropping the least recently used once it is full.
+    def __init__(self, size):
+        self.size = size
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        if key in self.data:
+            self.data.move_to_end(key)  # Mark as most recently used.
+            self.hits = self.hits + 1
+            return self.data[key]
+        self.misses = self.misses + 1
+        return None
+
+    def put(self, key, value):
+        if self.size <= 0:
+            return
+        self.data[key] = value
+        self.data.move_to_end(key)
+        while len(self.data) > self.size:
+            self.data.popitem(last=False)  # Evict the least recently used entry.
+
+    def stats(self):
+        return {"size": len(self.data), "capacity": self.size, "hits": self.hits, "misses": self.misses}
+
+
+class HTTPError(Exception):  # Raised while handling a request to send back an error status.
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def parseNumbers(values):  # Turns the numbers given by the caller into ints greater than 0.
+    numbers = []
+    for value in values:
+        # Only real ints or strings of digits, int() would quietly round 1.5 down and can't handle inf or nan.
+        if isinstance(value, int) and not isinstance(value, bool):
+            number = value
+        elif isinstance(value, str) and value.isascii() and value.isdigit():
+            try:
+                number = int(value)
+            except ValueError:  # More digits than int() will read.
+                raise HTTPError(400, "number too long: " + value[:20] + "...")
+        else:
+            raise HTTPError(400, "not an integer: " + repr(value)[:40])
+        if number < 1:
+            raise HTTPError(400, "numbers must be at least 1, got " + str(number))
+        numbers.append(number)
+    if len(numbers) > MAX_BATCH:
+        raise HTTPError(413, "at most " + str(MAX_BATCH) + " numbers per batch")
+    return numbers
+
+
+def toJson(result):
+    ornum, highnum, runtimes = result
+    return {"original": ornum, "highest": highnum, "checked": runtimes}
+
+
+class CollatzService:
+    def __init__(self, cacheSize, workers):
+        self.cache = LRUCache(cacheSize)
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+
+    async def lookup(self, numbers):  # Answers from the cache where possible and sends the rest to the process pool.
+        results = {}
+        missing = []
+        for n in numbers:
+            if n in results:
+                continue
+            cached = self.cache.get(n)
+            if cached is None:
+                results[n] = None
+                missing.append(n)
+            else:
+                results[n] = cached
+        if missing:
+            loop = asyncio.get_running_loop()
+            chunks = [missing[i:i + CHUNK] for i in range(0, len(missing), CHUNK)]
+            answers = await asyncio.gather(*[loop.run_in_executor(self.pool, collatz.summaries, chunk) for chunk in chunks])
+            for chunk in answers:
+                for result in chunk:
+                    results[result[0]] = result
+                    self.cache.put(result[0], result)
+        return [results[n] for n in numbers]
+
+    async def route(self, method, target, body):
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        if url.path == "/summary":
+            if method != "GET":
+                raise HTTPError(405, "use GET for /summary")
+            if "n" not in query:
+                raise HTTPError(400, "missing ?n=")
+            result = await self.lookup(parseNumbers(query["n"][:1]))
+            return toJson(result[0])
+        if url.path == "/batch":
+            if method == "GET":
+                values = [value for item in query.get("n", []) for value in item.split(",") if value]
+            elif method == "POST":
+                try:
+                    payload = json.loads(body or b"{}")
+                except ValueError:
+                    raise HTTPError(400, "body is not valid JSON")
+                values = payload.get("numbers") if isinstance(payload, dict) else payload
+                if not isinstance(values, list):
+                    raise HTTPError(400, "expected {\"numbers\": [...]}")
+            else:
+                raise HTTPError(405, "use GET or POST for /batch")
+            results = await self.lookup(parseNumbers(values))
+            return {"results": [toJson(result) for result in results]}
+        if url.path == "/stats":
+            return self.cache.stats()
+        raise HTTPError(404, "unknown path " + url.path)
+
+    async def handle(self, reader, writer):  # Serves one connection, keeping it open between requests (keep-alive).
+        try:
+            while True:
+                try:
+                    requestLine = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):  # Longer than MAX_LINE.
+                    await self.respond(writer, 414, {"error": "request line too long"}, False)
+                    break
+                if not requestLine:
+                    break
+                try:
+                    method, target, version = requestLine.decode("latin-1").split()
+                except ValueError:
+                    await self.respond(writer, 400, {"error": "bad request line"}, False)
+                    break
+                headers = {}
+                tooLong = False
+                while True:
+                    try:
+                        line = await reader.readline()
+                    except (ValueError, asyncio.LimitOverrunError):
+                        tooLong = True
+                        break
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                if tooLong:
+                    await self.respond(writer, 431, {"error": "header too long"}, False)
+                    break
+                keepAlive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                try:
+                    length = int(headers.get("content-length", "0"))
+                except ValueError:
+                    await self.respond(writer, 400, {"error": "bad Content-Length"}, False)
+                    break
+                try:
+                    if length > MAX_BODY:
+                        raise HTTPError(413, "request body too large")
+                    body = await reader.readexactly(length) if length > 0 else b""
+                    status, payload = 200, await self.route(method, target, body)
+                except HTTPError as error:
+                    status, payload = error.status, {"error": error.message}
+                    keepAlive = keepAlive and status != 413
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    raise
+                except Exception:  # A bug in a handler still gets an answer instead of a dropped connection.
+                    traceback.print_exc()
+                    status, payload, keepAlive = 500, {"error": "internal error"}, False
+                await self.respond(writer, status, payload, keepAlive)
+                if not keepAlive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, writer, status, payload, keepAlive):
+        body = json.dumps(payload).encode()
+        head = "HTTP/1.1 %d %s\r\nContent-Type: application/json\r\nContent-Length: %d\r\nConnection: %s\r\n\r\n" % (
+            status, REASONS[status], len(body), "keep-alive" if keepAlive else "close")
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+
+async def main(host, port, cacheSize, workers):
+    service = CollatzService(cacheSize, workers)
+    server = await asyncio.start_server(service.handle, host, port, limit=MAX_LINE)
+    print("Collatz service listening on http://" + host + ":" + str(port))
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.pool.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local HTTP/JSON service for Collatz Conjecture summaries.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8031)
+    parser.add_argument("--cache-size", type=int, default=100000, help="how many answers the LRU cache keeps")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per core)")
+    args = parser.parse_args()
+    try:
+        asyncio.run(main(args.host, args.port, args.cache_size, args.workers))
+    except KeyboardInterrupt:
+        pass
@@ -1,17 +1,20 @@
 import numpy as np
 import statistics
 import math
+import sys
+from series import evenSum, evenTerms, trace  # Closed form sums, see series.py
+from summ_batch import batchFromArgs  # python even-summ.py --batch questions.txt answers many at once
+
+if batchFromArgs(2):
+    sys.exit()
+traceMode = "--trace" in sys.argv  # python even-summ.py --trace prints every term like the old loop did.
 run = 1
 
 while run == 1:
     i = int(input("Start Value? >>>"))
     k = int(input("Number Of Loops >>>"))
-    out2 = 0
-
-    for i in range(k):
-        x = i
-        out = 2 * x
-        print(out)
-
-        out2 = out2 + out
+    if traceMode:
+        out2 = trace(evenTerms(i, k))
+    else:
+        out2 = evenSum(i, k)
     print('Output =', out2)
@@ -0,0 +1,74 @@
+# Shared factorial for the Pascal's triangle scripts.
+# The old factorial(a) multiplied 1*2*3*...*a one at a time, so almost every step multiplied a huge number by a
+# tiny one. Binary splitting multiplies the two halves of the range separately and then together, so the big
+# multiplications are between numbers of about the same size, which Python does much faster.
+# Some results are kept as checkpoints, so asking for a bigger factorial later only multiplies on the part of the
+# range past the nearest checkpoint.
+
+from bisect import bisect_right, insort
+
+SMALL = 8  # Ranges this short are multiplied in a plain loop.
+CHECKPOINT_MIN = 512  # Factorials below this are cheap enough that they are not worth keeping.
+MAX_CHECKPOINTS = 32  # How many checkpoints are kept, the oldest is dropped first.
+
+checkpoints = {}  # n -> n!
+checkpointOrder = []  # n values in the order they were stored.
+checkpointKeys = []  # n values sorted, for finding the nearest checkpoint below a request.
+
+
+def product(values, lo=0, hi=None):  # Multiplies values[lo:hi] together as a balanced tree.
+    if hi is None:
+        hi = len(values)
+    if hi - lo <= SMALL:
+        result = 1
+        for i in range(lo, hi):
+            result = result * values[i]
+        return result
+    mid = (lo + hi) // 2
+    return product(values, lo, mid) * product(values, mid, hi)
+
+
+def rangeProduct(lo, hi):  # lo * (lo+1) * ... * hi by binary splitting, 1 when the range is empty.
+    if hi - lo < SMALL:
+        result = 1
+        for j in range(lo, hi + 1):
+            result = result * j
+        return result
+    mid = (lo + hi) // 2
+    return rangeProduct(lo, mid) * rangeProduct(mid + 1, hi)
+
+
+def remember(a, value):  # Keeps a! unless it is small or a checkpoint close below it already covers it.
+    if a < CHECKPOINT_MIN or a in checkpoints:
+        return
+    i = bisect_right(checkpointKeys, a)
+    if i and a - checkpointKeys[i - 1] < a // 16:
+        return
+    checkpoints[a] = value
+    checkpointOrder.append(a)
+    insort(checkpointKeys, a)
+    if len(checkpointOrder) > MAX_CHECKPOINTS:
+        oldest = checkpointOrder.pop(0)
+        del checkpoints[oldest]
+        checkpointKeys.remove(oldest)
+
+
+def factorial(a):  # a! for a whole number a >= 0.
+    if a < 0:
+        raise ValueError("factorial() not defined for negative values, got " + str(a))
+    i = bisect_right(checkpointKeys, a)
+    if i:
+        start = checkpointKeys[i - 1]
+        if start == a:
+            return checkpoints[a]
+        value = checkpoints[start] * rangeProduct(start + 1, a)
+    else:
+        value = rangeProduct(2, a)
+    remember(a, value)
+    return value
+
+
+def clearCheckpoints():
+    checkpoints.clear()
+    checkpointOrder.clear()
+    checkpointKeys.clear()
@@ -0,0 +1,58 @@
+# Sums of powers, 1^p + 2^p + ... + n^p, and of any polynomial, in closed form.
+# Faulhaber's formula writes the sum of p-th powers as a polynomial in n of degree p+1 whose coefficients come
+# from the Bernoulli numbers. The coefficients are worked out once per power as exact fractions and kept, after
+# that any range is one polynomial evaluation, O(p) steps whatever the size of the range.
+
+from fractions import Fraction
+from math import comb, lcm
+
+bernoulliCache = [Fraction(1)]  # B_0, B_1, ... with B_1 = +1/2, the sign that suits sums up to n.
+coefficientCache = {}  # p -> (integer numerators, common denominator), lowest power first.
+
+
+def bernoulli(m):
+    while len(bernoulliCache) <= m:
+        j = len(bernoulliCache)
+        # From sum_{i=0..j} C(j+1,i) B_i = j+1 (the B_1 = +1/2 convention).
+        total = sum(comb(j + 1, i) * bernoulliCache[i] for i in range(j))
+        bernoulliCache.append((Fraction(j + 1) - total) / (j + 1))
+    return bernoulliCache[m]
+
+
+def coefficients(p):  # Exact fractions c_0..c_{p+1} with 1^p + ... + n^p = sum of c_i * n^i.
+    if p < 0:
+        raise ValueError("Power must be 0 or more, got " + str(p))
+    coeffs = [Fraction(0)] * (p + 2)
+    for j in range(p + 1):
+        coeffs[p + 1 - j] = Fraction(comb(p + 1, j)) * bernoulli(j) / (p + 1)
+    return coeffs
+
+
+def integerForm(p):  # The coefficients over one common denominator, so evaluating stays in whole numbers.
+    if p not in coefficientCache:
+        coeffs = coefficients(p)
+        denominator = lcm(*[c.denominator for c in coeffs])
+        coefficientCache[p] = ([int(c * denominator) for c in coeffs], denominator)
+    return coefficientCache[p]
+
+
+def prefixPowerSum(p, n):  # 1^p + ... + n^p, the polynomial also gives the right answer for n <= 0.
+    numerators, denominator = integerForm(p)
+    total = 0
+    for c in reversed(numerators):  # Horner's method.
+        total = total * n + c
+    return total // denominator
+
+
+def powerSum(p, lo, hi):  # lo^p + (lo+1)^p + ... + hi^p.
+    if hi < lo:
+        return 0
+    return prefixPowerSum(p, hi) - prefixPowerSum(p, lo - 1)
+
+
+def polynomialSum(coeffs, lo, hi):  # Sum of a0 + a1*k + a2*k^2 + ... for k = lo..hi, coeffs = [a0, a1, a2, ...].
+    total = sum(a * powerSum(j, lo, hi) for j, a in enumerate(coeffs) if a)
+    if isinstance(total, Fraction) and total.denominator == 1:
+        return total.numerator
+    return total
+
@@ -0,0 +1,265 @@
+# Pascal's triangle row engine shared by ptri.py and ptri-all.py.
+# Instead of working out every entry as factorial(n)/(factorial(n-m)*factorial(m)), each row is built from
+# the one before it (C(n,k) = C(n-1,k-1) + C(n-1,k)) or from its own left neighbour
+# (C(n,k+1) = C(n,k)*(n-k)/(k+1)), so a row costs O(n) exact integer operations.
+# Rows are the same forwards and backwards, so only the first half is worked out and MirroredRow reads the rest from it.
+# Everything here stays in exact Python integers. Floats are only used by the approx functions at the bottom,
+# which are a fast way to get the size of entries in huge rows when the exact digits are not needed.
+
+import math
+import sys
+from collections import OrderedDict
+from collections.abc import Sequence
+from itertools import islice
+from operator import add
+
+try:
+    import numpy as np
+except ImportError:  # Without NumPy every row uses the big number engine below.
+    np = None
+
+LOG10E = math.log10(math.e)
+UINT64_MAX_ROW = 67  # Row 67 is the last row whose biggest value, C(67,33), fits in an unsigned 64 bit integer.
+
+
+def combination(n, m):  # Exact C(n,m), "m" is the position in the row and "n" is the row number.
+    if m < 0 or m > n:
+        return 0
+    m = min(m, n - m)  # C(n,m) == C(n,n-m), so walk the shorter side.
+    value = 1
+    for k in range(m):
+        value = value * (n - k) // (k + 1)
+    return value
+
+
+def checkRow(n):
+    if n < 0:
+        raise ValueError("Row number must be 0 or more, got " + str(n))
+
+
+def halfRow(n):  # Returns the first half of row n (positions 0 to n//2) using C(n,k+1) = C(n,k)*(n-k)/(k+1).
+    checkRow(n)
+    out = [1] * (n // 2 + 1)
+    value = 1
+    for k in range(n // 2):
+        value = value * (n - k) // (k + 1)  # Always divides exactly because value*(n-k) is (k+1)*C(n,k+1).
+        out[k + 1] = value
+    return out
+
+
+def nextHalfRow(half, n):  # Takes the first half of row n and returns the first half of row n+1.
+    out = [1]
+    out.extend(map(int.__add__, half, half[1:]))
+    if n % 2 == 1:  # Row n+1 is even, its middle value is twice the middle pair of row n, which are equal.
+        out.append(half[-1] + half[-1])
+    return out
+
+
+class MirroredRow(Sequence):  # A full row of the triangle that only stores its first half.
+    # Every row reads the same backwards, so position i past the middle is looked up at position n-i.
+    # Nothing is copied to make the full row, it behaves like a read only list.
+    __slots__ = ("half", "n")
+
+    def __init__(self, half, n):
+        self.half = half
+        self.n = n
+
+    def __len__(self):
+        return self.n + 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.n + 1))]
+        if i < 0:
+            i = i + self.n + 1
+        if i < 0 or i > self.n:
+            raise IndexError("row index out of range")
+        if i > self.n // 2:
+            i = self.n - i
+        return self.half[i]
+
+    def __iter__(self):
+        yield from self.half
+        mirror = reversed(self.half)
+        if self.n % 2 == 0:
+            next(mirror, None)  # Even rows have one middle value, it was already given by the first half.
+        yield from mirror
+
+    def __reversed__(self):
+        return iter(self)
+
+    def __eq__(self, other):
+        if isinstance(other, MirroredRow):
+            return self.n == other.n and self.half == other.half
+        if isinstance(other, Sequence):
+            return len(other) == self.n + 1 and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "[" + ", ".join(map(repr, self)) + "]"
+
+    def copy(self):  # A MirroredRow with its own half, for keeping a row that rowStream() will reuse.
+        return MirroredRow(list(self.half), self.n)
+
+
+def halfOf(r):  # (n, first half) of any row, a MirroredRow, a list or a NumPy array.
+    if isinstance(r, MirroredRow):
+        return r.n, r.half
+    n = len(r) - 1
+    half = r[:n // 2 + 1]
+    return n, half.tolist() if hasattr(half, "tolist") else half  # NumPy values become Python ints.
+
+
+def row(n):  # Returns row n (starting at row 0), only the first half is computed.
+    return MirroredRow(halfRow(n), n)
+
+
+def nextRow(prev):  # Returns the row after prev (a MirroredRow) by adding neighbouring entries.
+    return MirroredRow(nextHalfRow(prev.half, prev.n), prev.n + 1)
+
+
+def rows(stop=None, start=0):  # Yields rows start, start+1, ... up to and including row stop (forever if stop is None).
+    current = row(start)
+    while stop is None or current.n <= stop:
+        yield current
+        current = nextRow(current)
+
+
+def rowStream(stop=None, start=0, first=None):  # Like rows(), but reuses two half row buffers instead of new lists.
+    # Rows come out as MirroredRow views over the buffers, so a row is only valid until the loop asks for the
+    # row after next. Use .copy() on a row to keep it. first can be a row to carry on from instead of start.
+    if first is None:
+        first = row(start)
+    n = first.n
+    current = list(first.half)
+    spare = [1] * ((n - 1) // 2 + 1)  # Sized for row n-1, it only ever grows by one value per row.
+    views = (MirroredRow(current, n), MirroredRow(spare, n + 1))
+    which = 0
+    while stop is None or n <= stop:
+        view = views[which]
+        view.n = n
+        yield view
+        nxt = views[1 - which].half
+        nxt.append(1)  # Row n+1 has one more value in its half than row n-1 had.
+        nxt[1:len(current)] = map(add, current, islice(current, 1, None))
+        if n % 2 == 1:  # Row n+1 is even, its middle value is twice the middle pair of row n.
+            nxt[-1] = current[-1] + current[-1]
+        current = nxt
+        which = 1 - which
+        n = n + 1
+
+
+smallRows = []  # Rows 0..67 as read only uint64 arrays, built the first time one is asked for.
+
+
+def buildSmallRows():
+    current = np.ones(1, dtype=np.uint64)
+    current.flags.writeable = False
+    smallRows.append(current)
+    for i in range(UINT64_MAX_ROW):
+        nxt = np.empty(i + 2, dtype=np.uint64)
+        nxt[0] = nxt[-1] = 1
+        np.add(current[1:], current[:-1], out=nxt[1:-1])  # Whole row of neighbour sums in one vectorized step.
+        nxt.flags.writeable = False
+        smallRows.append(nxt)
+        current = nxt
+
+
+def arrayRow(n):  # Row n as a NumPy uint64 array while it fits, otherwise the big number MirroredRow.
+    if np is None or n > UINT64_MAX_ROW:
+        return row(n)
+    checkRow(n)
+    if not smallRows:
+        buildSmallRows()
+    return smallRows[n]
+
+
+def previousHalfRow(half, n):  # Takes the first half of row n and returns the first half of row n-1.
+    out = [1] * ((n - 1) // 2 + 1)
+    value = 1
+    for k in range(1, len(out)):
+        value = half[k] - value  # C(n-1,k) = C(n,k) - C(n-1,k-1), so stepping back is only subtraction.
+        out[k] = value
+    return out
+
+
+def previousRow(nxt):  # Returns the row before nxt (a MirroredRow).
+    if nxt.n == 0:
+        raise ValueError("Row 0 has no row before it")
+    return MirroredRow(previousHalfRow(nxt.half, nxt.n), nxt.n - 1)
+
+
+def rowBytes(r):  # Roughly how much memory a MirroredRow holds, big numbers count by their real size.
+    return sys.getsizeof(r.half) + sum(map(sys.getsizeof, r.half))
+
+
+class RowCache:  # Keeps recently used rows until their total size passes maxBytes, then drops the least recently used.
+    # A request for a row next to a cached one steps from it (one addition or subtraction per entry)
+    # instead of working the row out from nothing.
+    def __init__(self, maxBytes=64 * 1024 * 1024, compute=None):
+        self.maxBytes = maxBytes
+        self.compute = compute or row  # Used for rows with no cached neighbour.
+        self.rows = OrderedDict()  # Row number -> (MirroredRow, size in bytes), least recently used first.
+        self.bytes = 0
+        self.hits = 0
+        self.steps = 0
+        self.misses = 0
+
+    def get(self, n):
+        if n in self.rows:
+            self.rows.move_to_end(n)
+            self.hits = self.hits + 1
+            return self.rows[n][0]
+        if n - 1 in self.rows:
+            r = nextRow(self.rows[n - 1][0])
+            self.steps = self.steps + 1
+        elif n + 1 in self.rows:
+            r = previousRow(self.rows[n + 1][0])
+            self.steps = self.steps + 1
+        else:
+            r = self.compute(n)
+            self.misses = self.misses + 1
+        self.put(r)
+        return r
+
+    def put(self, r):
+        size = rowBytes(r)
+        if r.n in self.rows:
+            self.bytes = self.bytes - self.rows[r.n][1]
+        self.rows[r.n] = (r, size)
+        self.rows.move_to_end(r.n)
+        self.bytes = self.bytes + size
+        while self.bytes > self.maxBytes and len(self.rows) > 1:  # Always keep the newest row, even if it alone is too big.
+            _, (_, dropped) = self.rows.popitem(last=False)
+            self.bytes = self.bytes - dropped
+
+    def __contains__(self, n):
+        return n in self.rows
+
+    def __len__(self):
+        return len(self.rows)
+
+
+# Fast approximate mode. These use log-gamma so they run in constant time per entry no matter how big the row is,
+# but the answers are floats with roughly 15 significant digits.
+
+def logCombination(n, m):  # Natural log of C(n,m).
+    if m < 0 or m > n:
+        return -math.inf
+    return math.lgamma(n + 1) - math.lgamma(m + 1) - math.lgamma(n - m + 1)
+
+
+def approxCombination(n, m):  # C(n,m) as a float, or inf once it is too big for a float.
+    try:
+        return math.exp(logCombination(n, m))
+    except OverflowError:
+        return math.inf
+
+
+def approxRow(n, log10=False):  # Row n as floats, or as base 10 logs (roughly the number of digits) when log10 is True.
+    checkRow(n)
+    if log10:
+        return MirroredRow([logCombination(n, k) * LOG10E for k in range(n // 2 + 1)], n)
+    return MirroredRow([approxCombination(n, k) for k in range(n // 2 + 1)], n)
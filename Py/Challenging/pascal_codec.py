@@ -0,0 +1,88 @@
+# Compact binary format for Pascal's triangle rows.
+# Written as decimal text every value becomes its digits plus ", " between them. Here each value is stored as
+# its little endian bytes (about 2.4 times smaller than its digits) with the byte count in front as a varint,
+# a number written 7 bits per byte where the top bit says another byte follows, so small numbers take one byte.
+#
+# A row is: varint row number, varint number of stored values, one mode byte, then the first half of the row
+# (the second half mirrors it). In delta mode each value is stored as the difference from the value before it,
+# which is noticeably smaller for the values near the edges. Differences go through zigzag encoding (sign in the
+# lowest bit) because rows that are not plain Pascal rows, like rows mod p, can go down as well as up.
+
+from pascal import MirroredRow, halfOf
+
+PLAIN = 0
+DELTA = 1
+
+
+def varint(value):  # value (0 or more) as varint bytes.
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value = value >> 7
+    out.append(value)
+    return bytes(out)
+
+
+def readVarint(buffer, pos):  # Returns (value, position after it).
+    byte = buffer[pos]
+    if byte < 0x80:  # The common one byte case.
+        return byte, pos + 1
+    value = 0
+    shift = 0
+    while True:
+        byte = buffer[pos]
+        pos = pos + 1
+        value = value | ((byte & 0x7F) << shift)
+        if byte < 0x80:
+            return value, pos
+        shift = shift + 7
+
+
+def encodeParts(row, delta=False):  # Yields one row in the compact format piece by piece.
+    n, half = halfOf(row)
+    yield varint(n) + varint(len(half)) + bytes((DELTA if delta else PLAIN,))
+    previous = 0
+    for value in half:
+        if delta:
+            value, previous = value - previous, value
+            value = value << 1 if value >= 0 else ((-value) << 1) - 1  # Zigzag: 0, -1, 1, -2 ... -> 0, 1, 2, 3 ...
+        size = (value.bit_length() + 7) // 8
+        yield varint(size)
+        if size:
+            yield value.to_bytes(size, "little")
+
+
+def encodeRow(row, delta=False):
+    return b"".join(encodeParts(row, delta))
+
+
+def decodeRow(buffer, pos=0):  # Reads one row from bytes, a memoryview or an mmap. Returns (MirroredRow, position after it).
+    try:
+        n, pos = readVarint(buffer, pos)
+        count, pos = readVarint(buffer, pos)
+        mode = buffer[pos]
+        pos = pos + 1
+        if mode not in (PLAIN, DELTA):
+            raise ValueError("Unknown row mode " + str(mode))
+        fromBytes = int.from_bytes
+        half = [0] * count
+        total = 0
+        with memoryview(buffer) as view:
+            for k in range(count):
+                size = buffer[pos]
+                if size < 0x80:
+                    pos = pos + 1
+                else:
+                    size, pos = readVarint(buffer, pos)
+                end = pos + size
+                if end > len(buffer):
+                    raise EOFError("Row data ended in the middle of a row")
+                value = fromBytes(view[pos:end], "little")
+                pos = end
+                if mode == DELTA:
+                    total = total + (-((value + 1) >> 1) if value & 1 else value >> 1)
+                    value = total
+                half[k] = value
+    except IndexError:
+        raise EOFError("Row data ended in the middle of a row")
+    return MirroredRow(half, n), pos
@@ -0,0 +1,172 @@
+# Streaming output for Pascal's triangle rows.
+# RowWriter sends rows one at a time to a file or pipe through a large write buffer, so printing a long run of
+# rows is not held up by terminal I/O and only the row being written has to be in memory.
+#
+# Formats:
+#   text    one row per line, written exactly like print(row) would show it: [1, 4, 6, 4, 1]
+#   binary  every row is a 16 byte header (row number, number of stored values, both unsigned 64 bit little endian)
+#           followed by the first half of the row, each value as a 4 byte little endian length and then the
+#           value's little endian bytes. The second half is left out because it mirrors the first.
+#   varint  the compact format from pascal_codec.py, varint lengths instead of fixed 4 and 16 byte headers
+#   delta   the compact format with every value stored as the difference from the one before it
+
+import mmap
+import struct
+import sys
+
+import pascal_codec
+from pascal import MirroredRow, halfOf
+
+MAGIC = b"PTRI\x01\n"  # Start of every binary file, so readRows can tell it is looking at the right kind of file.
+COMPACT_MAGIC = b"PTRV\x01\n"  # Start of every varint or delta file.
+FORMATS = ("text", "binary", "varint", "delta")
+ROW = struct.Struct("<QQ")
+LENGTH = struct.Struct("<I")
+BUFFER_SIZE = 8 * 1024 * 1024  # 8 MB write buffer.
+
+
+def toBytes(value):
+    return value.to_bytes((value.bit_length() + 7) // 8 or 1, "little")
+
+
+class RowWriter:
+    def __init__(self, sink=None, fmt="text", bufferSize=BUFFER_SIZE):
+        if fmt not in FORMATS:
+            raise ValueError("Unknown row format " + repr(fmt) + ", use one of " + ", ".join(FORMATS))
+        self.fmt = fmt
+        if sink is None or sink == "-":
+            sys.stdout.flush()
+            self.file = open(sys.stdout.fileno(), "wb", buffering=bufferSize, closefd=False)
+            self.owned = True
+        elif isinstance(sink, str):
+            self.file = open(sink, "wb", buffering=bufferSize)
+            self.owned = True
+        else:
+            self.file = sink  # An already open binary file object, left open when the writer is closed.
+            self.owned = False
+        if fmt == "text" and hasattr(sys, "set_int_max_str_digits"):
+            sys.set_int_max_str_digits(0)  # Rows get far past Python's default 4300 digit limit for str(int).
+        if fmt == "binary":
+            self.file.write(MAGIC)
+        elif fmt in ("varint", "delta"):
+            self.file.write(COMPACT_MAGIC)
+
+    def write(self, row):
+        if self.fmt == "text":
+            self.writeText(row)
+        elif self.fmt == "binary":
+            self.writeBinary(row)
+        else:
+            self.file.writelines(pascal_codec.encodeParts(row, self.fmt == "delta"))
+
+    def writeText(self, row):
+        file = self.file
+        file.write(b"[")
+        first = True
+        for value in row:
+            if not first:
+                file.write(b", ")
+            file.write(repr(value).encode("ascii"))
+            first = False
+        file.write(b"]\n")
+
+    def writeBinary(self, row):
+        self.file.writelines(encodeParts(row))
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        if self.owned:
+            self.file.close()
+        else:
+            self.file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def encodeParts(row):  # Yields one row in the binary format piece by piece, without the file's MAGIC.
+    n, half = halfOf(row)
+    yield ROW.pack(n, len(half))
+    for value in half:
+        data = toBytes(value)
+        yield LENGTH.pack(len(data))
+        yield data
+
+
+def encodeRow(row):  # One row in the binary format as a single bytes object.
+    return b"".join(encodeParts(row))
+
+
+def decodeRow(buffer, pos=0):  # Reads one row from a bytes-like buffer (bytes, memoryview, mmap) at pos.
+    # Returns the row and the position just after it.
+    if pos + ROW.size > len(buffer):
+        raise EOFError("Row data ended in the middle of a row")
+    n, count = ROW.unpack_from(buffer, pos)
+    pos = pos + ROW.size
+    half = []
+    for _ in range(count):
+        if pos + LENGTH.size > len(buffer):
+            raise EOFError("Row data ended in the middle of a row")
+        size = LENGTH.unpack_from(buffer, pos)[0]
+        pos = pos + LENGTH.size
+        if pos + size > len(buffer):
+            raise EOFError("Row data ended in the middle of a row")
+        half.append(int.from_bytes(buffer[pos:pos + size], "little"))
+        pos = pos + size
+    return MirroredRow(half, n), pos
+
+
+def readExactly(file, size):
+    data = file.read(size)
+    if len(data) != size:
+        raise EOFError("Row file ended in the middle of a row")
+    return data
+
+
+def readRows(source):  # Yields every row of a binary, varint or delta row file (a path or an open binary file) as a MirroredRow.
+    file = open(source, "rb") if isinstance(source, str) else source
+    try:
+        magic = file.read(len(MAGIC))
+        if magic == COMPACT_MAGIC:
+            yield from readCompactRows(file)
+            return
+        if magic != MAGIC:
+            raise ValueError("Not a binary Pascal row file")
+        while True:
+            header = file.read(ROW.size)
+            if not header:
+                return
+            if len(header) != ROW.size:
+                raise EOFError("Row file ended in the middle of a row")
+            n, count = ROW.unpack(header)
+            half = []
+            for _ in range(count):
+                size = LENGTH.unpack(readExactly(file, LENGTH.size))[0]
+                half.append(int.from_bytes(readExactly(file, size), "little"))
+            yield MirroredRow(half, n)
+    finally:
+        if isinstance(source, str):
+            file.close()
+
+
+def readCompactRows(file):  # The compact formats have no fixed size headers, so decode them from a memory map.
+    start = file.tell()
+    try:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):  # Pipes and in-memory files can't be mapped, read them instead.
+        buffer = file.read()
+        start = 0
+    try:
+        pos = start
+        while pos < len(buffer):
+            row, pos = pascal_codec.decodeRow(buffer, pos)
+            yield row
+    finally:
+        if isinstance(buffer, mmap.mmap):
+            buffer.close()
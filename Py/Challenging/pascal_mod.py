@@ -0,0 +1,74 @@
+# Pascal's triangle modulo a small prime, using Lucas's theorem.
+# Lucas's theorem says C(n,k) mod p is the product of C(n_i,k_i) mod p over the base p digits n_i and k_i
+# of n and k. Each of those small binomials comes from factorial tables mod p that are built once per prime,
+# so one entry costs O(log_p n) no matter how big n is, and a row slice costs time proportional to its length.
+# For example p = 2 gives the parity of every entry, which draws the Sierpinski triangle.
+
+
+def isPrime(p):
+    if p < 2:
+        return False
+    i = 2
+    while i * i <= p:
+        if p % i == 0:
+            return False
+        i = i + 1
+    return True
+
+
+class LucasTable:  # Factorial and inverse factorial tables mod p for one prime p.
+    def __init__(self, p):
+        if not isPrime(p):
+            raise ValueError("Lucas's theorem needs a prime modulus, got " + str(p))
+        self.p = p
+        fact = [1] * p
+        for i in range(1, p):
+            fact[i] = fact[i - 1] * i % p
+        inverse = [1] * p
+        inverse[p - 1] = pow(fact[p - 1], p - 2, p)  # Fermat's little theorem, a^(p-2) is the inverse of a mod p.
+        for i in range(p - 1, 0, -1):
+            inverse[i - 1] = inverse[i] * i % p
+        self.fact = fact
+        self.inverse = inverse
+
+    def small(self, n, k):  # C(n,k) mod p for 0 <= n, k < p.
+        if k > n:
+            return 0
+        return self.fact[n] * self.inverse[k] % self.p * self.inverse[n - k] % self.p
+
+    def combination(self, n, k):  # C(n,k) mod p for any n and k.
+        if k < 0 or k > n:
+            return 0
+        p = self.p
+        result = 1
+        while k > 0:
+            n, ni = divmod(n, p)
+            k, ki = divmod(k, p)
+            if ki > ni:
+                return 0  # A digit of k bigger than the matching digit of n makes the whole entry 0 mod p.
+            result = result * self.small(ni, ki) % p
+        return result
+
+    def row(self, n, start=0, stop=None):  # Entries start..stop-1 of row n mod p (the whole row by default).
+        if stop is None:
+            stop = n + 1
+        start = max(start, 0)
+        stop = min(stop, n + 1)
+        return [self.combination(n, k) for k in range(start, stop)]
+
+
+tables = {}  # Prime -> LucasTable, so each table is only built once.
+
+
+def table(p):
+    if p not in tables:
+        tables[p] = LucasTable(p)
+    return tables[p]
+
+
+def combinationMod(n, k, p):  # C(n,k) mod p.
+    return table(p).combination(n, k)
+
+
+def rowMod(n, p, start=0, stop=None):  # Entries start..stop-1 of row n mod p.
+    return table(p).row(n, start, stop)
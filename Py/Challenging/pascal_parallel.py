@@ -0,0 +1,54 @@
+# Works out one very large row of Pascal's triangle (n around a million) on several processes at once.
+# The first half of the row is cut into contiguous blocks. Each worker finds the first value of its block on its
+# own with the fast single entry routine in binomial.py, then walks along the block with
+# C(n,k+1) = C(n,k)*(n-k)/(k+1). Blocks come back in order, so they can be streamed out as they finish.
+# Scripts that use this need their main loop under if __name__ == "__main__": so worker processes can import them.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from binomial import binomial
+from pascal import MirroredRow
+
+MIN_BLOCK = 2048  # Blocks smaller than this cost more to send between processes than they save.
+
+
+def block(n, lo, hi):  # Values lo..hi-1 of row n.
+    value = binomial(n, lo)
+    out = [value]
+    for k in range(lo, hi - 1):
+        value = value * (n - k) // (k + 1)
+        out.append(value)
+    return out
+
+
+def blockBounds(n, workers, blocksPerWorker=4):  # Splits positions 0..n//2 into [(lo, hi), ...].
+    count = n // 2 + 1
+    blocks = max(1, min(workers * blocksPerWorker, count // MIN_BLOCK))
+    size = -(-count // blocks)  # Round up so the last block is never longer than the others.
+    return [(lo, min(lo + size, count)) for lo in range(0, count, size)]
+
+
+def rowBlocks(n, workers=None, pool=None):  # Yields the first half of row n block by block, in order.
+    if n < 0:
+        raise ValueError("Row number must be 0 or more, got " + str(n))
+    workers = workers or os.cpu_count() or 1
+    bounds = blockBounds(n, workers)
+    if len(bounds) == 1:  # Too small to be worth other processes.
+        yield block(n, 0, bounds[0][1])
+        return
+    own = pool is None
+    if own:
+        pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        yield from pool.map(block, [n] * len(bounds), [lo for lo, hi in bounds], [hi for lo, hi in bounds])
+    finally:
+        if own:
+            pool.shutdown()
+
+
+def parallelRow(n, workers=None, pool=None):  # Row n as a MirroredRow, worked out across processes.
+    half = []
+    for part in rowBlocks(n, workers, pool):
+        half.extend(part)
+    return MirroredRow(half, n)
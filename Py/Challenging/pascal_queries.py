@@ -0,0 +1,112 @@
+# Sums over parts of Pascal's triangle without adding up the values one by one.
+#   rangeSum(n, lo, hi)     C(n,lo) + ... + C(n,hi), part of one row
+#   columnSum(k, lo, hi)    C(lo,k) + ... + C(hi,k), down one column. The hockey-stick identity makes this
+#                           C(hi+1,k+1) - C(lo,k+1), two values instead of hi-lo+1.
+#   diagonalSum(r, m)       C(r,0) + C(r+1,1) + ... + C(r+m,m), along a diagonal, which is C(r+m+1,m)
+#
+# Part of a row has no single formula, so it comes from prefix sums. A row's prefix sums are built once, using
+# S(n,m) = 2*S(n-1,m) - C(n-1,m) to step them from the row before, and after that any range of the row is
+# one subtraction. Rows are symmetric and add up to 2^n, so only the first half of the prefix sums is stored.
+
+from collections import OrderedDict
+
+from binomial import binomial
+from pascal import combination, halfRow, checkRow
+
+PREFIX_ROWS = 64  # How many rows of prefix sums are kept, least recently used are dropped first.
+
+
+def entry(n, k):  # C(n,k), 0 outside the triangle.
+    if k < 0 or k > n:
+        return 0
+    if min(k, n - k) < 256:
+        return combination(n, k)
+    return binomial(n, k)
+
+
+def halfPrefix(n):  # S(n,m) = C(n,0) + ... + C(n,m) for m = 0..n//2.
+    out = []
+    total = 0
+    for value in halfRow(n):
+        total = total + value
+        out.append(total)
+    return out
+
+
+def nextHalfPrefix(prefix, n):  # Prefix sums of row n (first half) -> prefix sums of row n+1 (first half).
+    # S(n+1,m) = 2*S(n,m) - C(n,m), and C(n,m) is the step between neighbouring prefix sums.
+    size = (n + 1) // 2 + 1
+    out = [1] * size
+    for m in range(1, size):
+        if m < len(prefix):
+            sm = prefix[m]
+            cm = prefix[m] - prefix[m - 1]
+        else:  # Only happens for the middle of an even row n+1, use the symmetry of row n.
+            sm = (1 << n) - prefix[n - m - 1] if n - m - 1 >= 0 else 1 << n
+            cm = prefix[n - m] - (prefix[n - m - 1] if n - m - 1 >= 0 else 0)
+        out[m] = 2 * sm - cm
+    return out
+
+
+class PrefixSums:  # Keeps prefix sums for recently used rows, stepping from a neighbouring row when it can.
+    def __init__(self, size=PREFIX_ROWS):
+        self.size = size
+        self.rows = OrderedDict()
+
+    def half(self, n):
+        if n in self.rows:
+            self.rows.move_to_end(n)
+            return self.rows[n]
+        if n - 1 in self.rows:
+            prefix = nextHalfPrefix(self.rows[n - 1], n - 1)
+        else:
+            prefix = halfPrefix(n)
+        self.rows[n] = prefix
+        while len(self.rows) > self.size:
+            self.rows.popitem(last=False)
+        return prefix
+
+    def prefix(self, n, m):  # S(n,m) = C(n,0) + ... + C(n,m).
+        checkRow(n)
+        if m < 0:
+            return 0
+        if m >= n:
+            return 1 << n
+        if m > n // 2:  # The values after m mirror the values before n-m.
+            return (1 << n) - self.half(n)[n - m - 1]
+        return self.half(n)[m]
+
+
+prefixSums = PrefixSums()
+
+
+def rowPrefix(n, m):
+    return prefixSums.prefix(n, m)
+
+
+def rangeSum(n, lo, hi):  # C(n,lo) + ... + C(n,hi).
+    checkRow(n)
+    lo = max(lo, 0)
+    hi = min(hi, n)
+    if lo > hi:
+        return 0
+    if lo == 0 and hi == n:
+        return 1 << n
+    if hi - lo < 8:  # A few values are quicker to work out directly than to build a row of prefix sums.
+        return sum(entry(n, k) for k in range(lo, hi + 1))
+    return rowPrefix(n, hi) - rowPrefix(n, lo - 1)
+
+
+def columnSum(k, lo, hi):  # C(lo,k) + C(lo+1,k) + ... + C(hi,k), by the hockey-stick identity.
+    if k < 0:
+        raise ValueError("Column must be 0 or more, got " + str(k))
+    lo = max(lo, 0)
+    if lo > hi:
+        return 0
+    return entry(hi + 1, k + 1) - entry(lo, k + 1)
+
+
+def diagonalSum(r, m):  # C(r,0) + C(r+1,1) + ... + C(r+m,m), the other hockey stick.
+    if r < 0 or m < 0:
+        raise ValueError("Diagonal start and length must be 0 or more")
+    return entry(r + m + 1, m)
@@ -0,0 +1,80 @@
+# Facts about a whole row of Pascal's triangle that can be answered without building the row.
+#   rowSum(n)        every row adds up to 2^n
+#   oddCount(n)      the number of odd values is 2^(number of 1 bits in n) (Lucas's theorem with p = 2)
+#   maxEntry(n)      the biggest value is the middle one, C(n, n//2)
+#   maxEstimate(n)   about 2^n * sqrt(2/(pi*n)), a float estimate of the middle value for huge rows
+#   digits(n, k)     how many decimal digits C(n,k) has
+#   rowDigits(n)     how many decimal digits the whole row has, added up
+
+import math
+
+from binomial import binomial
+from pascal import logCombination, LOG10E, checkRow
+
+
+def rowSum(n):
+    checkRow(n)
+    return 1 << n
+
+
+def oddCount(n):
+    checkRow(n)
+    return 1 << bin(n).count("1")
+
+
+def evenCount(n):
+    return n + 1 - oddCount(n)
+
+
+def maxEntry(n):  # Exact, using the prime factorization engine for big rows.
+    checkRow(n)
+    return binomial(n, n // 2)
+
+
+def maxEstimate(n):  # Central binomial estimate, C(2m,m) ~ 4^m / sqrt(pi*m) * (1 - 1/(8m)) with m = n//2.
+    checkRow(n)
+    if n < 2:
+        return 1.0
+    m = n // 2
+    scale = (1 - 1 / (8 * m)) / math.sqrt(math.pi * m)
+    if n % 2 == 1:
+        scale = scale * (2 * m + 1) / (m + 1)  # C(2m+1,m) = C(2m,m) * (2m+1)/(m+1).
+    try:
+        return math.ldexp(scale, 2 * m)
+    except OverflowError:
+        return math.inf
+
+
+def log10Max(n):  # Base 10 log of the biggest value, fine for any n.
+    checkRow(n)
+    return logCombination(n, n // 2) * LOG10E
+
+
+def digits(n, k):  # Decimal digits in C(n,k), exact even when the log estimate lands right next to a whole number.
+    checkRow(n)
+    if k < 0 or k > n:
+        raise ValueError("Position must be between 0 and " + str(n) + ", got " + str(k))
+    estimate = logCombination(n, k) * LOG10E
+    guess = math.floor(estimate) + 1
+    slack = 1e-13 * math.lgamma(n + 1) + 1e-12  # How far the log-gamma rounding error could move the estimate.
+    if abs(estimate - round(estimate)) > slack:
+        return guess
+    value = binomial(n, k)  # Too close to a power of 10 to trust the float, check against the exact value.
+    if value < 10 ** (guess - 1):
+        return guess - 1
+    if value >= 10 ** guess:
+        return guess + 1
+    return guess
+
+
+def maxDigits(n):
+    return digits(n, n // 2)
+
+
+def rowDigits(n):  # Decimal digits of every value in row n added up, only ever looking at one value at a time.
+    checkRow(n)
+    total = 0
+    for k in range(n // 2 + 1):  # The row is the same backwards, so count the first half twice.
+        d = digits(n, k)
+        total = total + (d if 2 * k == n else 2 * d)
+    return total
@@ -0,0 +1,88 @@
+# On-disk store for the rows ptri-all.py generates, so a row that was worked out once never has to be again.
+# Rows 0, 1, 2, ... are kept one after another in <path>.rows in the binary row format from pascal_io.py.
+# <path>.idx lists, as unsigned 64 bit little endian numbers, where each row ends in the .rows file, so row n
+# can be found straight away. Rows are read by memory-mapping the .rows file instead of loading it.
+# The index is only written after a row's data is, so if a run is stopped halfway through a row, the
+# half written row is dropped the next time the store is opened and generation resumes after the last full row.
+
+import mmap
+import os
+from array import array
+
+from pascal_io import MAGIC, encodeParts, decodeRow
+
+
+class RowStore:
+    def __init__(self, path):
+        self.dataPath = path + ".rows"
+        self.indexPath = path + ".idx"
+        self.ends = array("Q")  # ends[n] is where row n stops in the .rows file.
+        if os.path.exists(self.indexPath):
+            with open(self.indexPath, "rb") as file:
+                raw = file.read()
+            self.ends.frombytes(raw[:len(raw) - len(raw) % self.ends.itemsize])  # Drop a half written entry.
+        if not os.path.exists(self.dataPath):
+            with open(self.dataPath, "wb") as file:
+                file.write(MAGIC)
+        size = os.path.getsize(self.dataPath)
+        while self.ends and self.ends[-1] > size:  # The index points past the data, forget those rows.
+            self.ends.pop()
+        dataEnd = self.ends[-1] if self.ends else len(MAGIC)
+        self.data = open(self.dataPath, "r+b")
+        if self.data.read(len(MAGIC)) != MAGIC:
+            self.data.close()
+            raise ValueError(self.dataPath + " is not a Pascal row store")
+        self.data.truncate(dataEnd)  # Throw away any row that was not finished.
+        self.data.seek(dataEnd)
+        self.index = open(self.indexPath, "r+b" if os.path.exists(self.indexPath) else "wb")
+        self.index.truncate(len(self.ends) * self.ends.itemsize)
+        self.index.seek(0, os.SEEK_END)
+        self.map = None  # Memory map of the .rows file, remade when rows have been added since.
+        self.mapped = 0
+
+    def __len__(self):  # Number of rows stored, so the next row to add is row len(store).
+        return len(self.ends)
+
+    def append(self, row):
+        if len(row) - 1 != len(self.ends):
+            raise ValueError("Store holds rows 0.." + str(len(self.ends) - 1) + ", the next row must be row " + str(len(self.ends)))
+        self.data.writelines(encodeParts(row))
+        self.data.flush()
+        end = self.data.tell()
+        self.ends.append(end)
+        self.index.write(self.ends[-1:].tobytes())
+        self.index.flush()
+
+    def get(self, n):  # Row n as a MirroredRow, read through the memory map.
+        if n < 0 or n >= len(self.ends):
+            raise IndexError("Row " + str(n) + " is not in the store")
+        start = self.ends[n - 1] if n > 0 else len(MAGIC)
+        if self.map is None or self.mapped < self.ends[n]:
+            self.remap()
+        row, _ = decodeRow(self.map, start)
+        return row
+
+    def last(self):  # The last stored row, or None when the store is empty.
+        if not self.ends:
+            return None
+        return self.get(len(self.ends) - 1)
+
+    def remap(self):
+        if self.map is not None:
+            self.map.close()
+        self.mapped = self.ends[-1]
+        self.map = mmap.mmap(self.data.fileno(), self.mapped, access=mmap.ACCESS_READ)
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        self.data.close()
+        self.index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -0,0 +1,89 @@
+# Optional phase profiler for the scripts in this folder.
+# Turn it on with the environment variable COLLATZ_PROFILE=1 (or by passing --profile to the script),
+# for example: COLLATZ_PROFILE=1 python 3n+1-Task.py
+# When it is on, every phase records its cumulative time and number of calls and a report is printed at exit.
+# When it is off, phase() hands back one shared do-nothing object and timed() returns the function untouched,
+# so the scripts pay next to nothing for having the hooks in place.
+
+import atexit
+import os
+import sys
+import time
+
+ENABLED = os.environ.get("COLLATZ_PROFILE", "") not in ("", "0") or "--profile" in sys.argv
+
+totals = {}  # Phase name -> cumulative seconds.
+calls = {}  # Phase name -> number of times the phase ran.
+
+
+class Phase:  # Times one run of a phase when used in a with block.
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        totals[self.name] = totals.get(self.name, 0.0) + (time.perf_counter() - self.start)
+        calls[self.name] = calls.get(self.name, 0) + 1
+        return False
+
+
+class NoPhase:  # Stand-in used while profiling is off.
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NOPHASE = NoPhase()
+
+
+def phase(name):  # Use as: with phase("plotting"): ...
+    if ENABLED:
+        return Phase(name)
+    return NOPHASE
+
+
+def timed(name):  # Decorator version of phase() for whole functions.
+    def wrap(func):
+        if not ENABLED:
+            return func
+
+        def timedFunc(*args, **kwargs):
+            with Phase(name):
+                return func(*args, **kwargs)
+        timedFunc.__name__ = func.__name__
+        timedFunc.__doc__ = func.__doc__
+        return timedFunc
+    return wrap
+
+
+def report(file=None):  # Prints a table of every phase sorted by the time spent in it.
+    file = file or sys.stderr
+    if not totals:
+        return
+    overall = sum(totals.values())
+    print('', file=file)
+    print('-------------------------------------------------------------', file=file)
+    print('%-20s %12s %10s %12s %6s' % ("Phase", "Total (s)", "Calls", "Per call", "%"), file=file)
+    for name in sorted(totals, key=totals.get, reverse=True):
+        seconds = totals[name]
+        share = 100.0 * seconds / overall if overall else 0.0
+        print('%-20s %12.6f %10d %12.3e %6.1f' % (name, seconds, calls[name], seconds / calls[name], share), file=file)
+    print('-------------------------------------------------------------', file=file)
+
+
+def reset():
+    totals.clear()
+    calls.clear()
+
+
+if ENABLED:
+    atexit.register(report)
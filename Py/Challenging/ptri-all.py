@@ -1,57 +1,53 @@
 import numpy as np
 import statistics
 import math
+import sys
+from pascal import nextRow, rowStream, approxRow  # Builds each row from the one before it, see pascal.py
+from pascal_mod import rowMod
+from pascal_io import RowWriter  # Buffered output, see pascal_io.py
+from pascal_store import RowStore  # Rows saved on disk, see pascal_store.py
+
+approx = "--approx" in sys.argv  # python ptri-all.py --approx prints fast float approximations instead of exact rows.
+mod = int(sys.argv[sys.argv.index("--mod") + 1]) if "--mod" in sys.argv else None  # python ptri-all.py --mod 2 prints rows mod a prime (Sierpinski pattern).
+out = sys.argv[sys.argv.index("--out") + 1] if "--out" in sys.argv else None  # python ptri-all.py --out rows.txt writes to a file instead of the screen.
+fmt = sys.argv[sys.argv.index("--format") + 1] if "--format" in sys.argv else "text"  # --format binary, varint or delta writes a binary format, varint is the smallest (see pascal_codec.py).
+storePath = sys.argv[sys.argv.index("--store") + 1] if "--store" in sys.argv else None  # python ptri-all.py --store tri saves every row and picks up where the last run stopped.
+if approx and fmt != "text":
+    sys.exit("--approx rows are floats and can only be written with --format text")
+if storePath and (approx or mod is not None):
+    sys.exit("--store only keeps exact rows, it can't be used with --approx or --mod")
+writer = RowWriter(out, fmt)
+store = RowStore(storePath) if storePath else None
 
 
-# def factorial(n):
-#     # single line to find factorial
-#     return 1 if (n == 1 or n == 0) else n * factorial(n - 1)
-
-
-run = 1
-n = -1
 maxrowval = 200000000
 # The max row value it will calculate
-while run == 1:
-    n = n + 1
-    max = n+1/2
-    if n == maxrowval:
-        run = 2
-    # Define factorial
-
-    def factorial(a):
-        Prod = 1
-        for j in range(1, a+1):
-            Prod = j*Prod
-        return Prod
-
-    # print("Factorial of", 7, "is", factorial(7)) = 720
-
-    # Define Combination
-
-    def combination(n, m):
-        Choose = factorial(n)/(factorial(n-m)*factorial(m))
-        # "m" is the postion in the array, "n" is the row number that you wish to get the values of.
-        return Choose
-
-    # For example, to find the 4th number(3rd position in Python) on the 7th row we would say:
-    # print("Combination of row", 7, "and position", 3, "is", combination(7, 3))
-
-    ar = []
-
-    length = len(ar)
-
-    len2 = n+1
-    for c in range(len2):
-        ar.append(1)
-    # Add blank values to the array as placeholders
-
-    # print(ar)
-
-    for c in range(n+1):
-        ar[c] = combination(n, c)
-    # For each value in the array combign it with the row  number and use the factorial funtion.
-
-    print(ar)
 
-    # Driver Code
+first = None
+if store is not None and len(store) > 0:
+    first = nextRow(store.last())  # Resume after the last row in the store.
+start = first.n if first is not None else 0
+
+# Each row is the previous row with neighbouring values added together, so there is no need to
+# work out factorial(n)/(factorial(n-m)*factorial(m)) for every value again. rowStream keeps two row
+# buffers and swaps between them, so no new lists are made per row.
+# For example, to find the 4th number(3rd position in Python) on the 7th row we would say:
+# print("Combination of row", 7, "and position", 3, "is", pascal.row(7)[3])
+
+if mod is not None:
+    allRows = (rowMod(n, mod) for n in range(start, maxrowval+1))
+elif approx:
+    allRows = (approxRow(n) for n in range(start, maxrowval+1))
+else:
+    allRows = rowStream(maxrowval, start, first)
+
+with writer:
+    for ar in allRows:
+        if store is not None:
+            store.append(ar)
+        writer.write(ar)
+
+if store is not None:
+    store.close()
+
+# Driver Code
@@ -1,51 +1,72 @@
 import numpy as np
 import statistics
 import math
+import os
+import sys
+from pascal import approxRow, arrayRow, row, RowCache, UINT64_MAX_ROW
+from pascal_parallel import parallelRow
+from pascal_mod import rowMod
+from binomial import binomial
+from factorial import factorial  # Binary splitting factorial, see factorial.py
 
-run = 1
-while run == 1:
-    n = int(input("Pick a line number? >>>"))
+approx = "--approx" in sys.argv  # python ptri.py --approx gives a fast float approximation for huge rows.
+mod = int(sys.argv[sys.argv.index("--mod") + 1]) if "--mod" in sys.argv else None  # python ptri.py --mod 2 gives entries mod a prime.
+entry = "--entry" in sys.argv  # python ptri.py --entry asks for one position and works out just that value.
+if hasattr(sys, "set_int_max_str_digits"):
+    sys.set_int_max_str_digits(0)  # Let print show values with more than 4300 digits.
+PARALLEL_MIN = 100000  # Rows from here up are split across all cores, see pascal_parallel.py
 
-    # Define factorial
 
-    def factorial(a):
-        Prod = 1
-        for j in range(1, a+1):
-            Prod = j*Prod
-        return Prod
+def computeRow(n):
+    if n >= PARALLEL_MIN and (os.cpu_count() or 1) > 1:
+        return parallelRow(n)
+    return row(n)
 
 
-    # Define Combination
-    def combination(n, m):
-        Choose = factorial(n)/(factorial(n-m)*factorial(m))
-        print("Choose = "+str(factorial(n))+"/"+str((factorial(n-m)*factorial(m))))
-        return Choose
+cache = RowCache(256 * 1024 * 1024, computeRow)  # Keeps up to 256 MB of recently asked for rows.
 
-    # For example, to find the 4th number(3rd position in Python) on the 7th row we would say:
-    # print("Combination of row", 7, "and position", 3, "is", combination(7, 3))
+if __name__ == "__main__":  # Keeps the worker processes from pascal_parallel.py from running the prompt loop.
+    run = 1
+    while run == 1:
+        n = int(input("Pick a line number? >>>"))
+        if n < 0:
+            print("Please enter a line number of 0 or more.")
+            continue
 
-    array = []
+        # Rows come from the cache when they were asked for recently, or are stepped from a cached row
+        # next to them, otherwise only the first half is worked out and the second half is a mirror of the first.
+        # For example, to find the 4th number(3rd position in Python) on the 7th row we would say:
+        # print("Combination of row", 7, "and position", 3, "is", cache.get(7)[3])
 
-    length = len(array)
+        if entry:
+            # One value of a huge row, built from its prime factors instead of the whole row, see binomial.py
+            m = int(input("Pick a position? >>>"))
+            print('')
+            if n <= 1000 and 0 <= m <= n:  # Show the working for rows small enough to read.
+                print("Choose = "+str(factorial(n))+"/"+str((factorial(n-m)*factorial(m))))
+            print('Combination of row', n, 'and position', m, 'is', binomial(n, m))
+            print('')
+            continue
 
-    len2 = n+1
-    for c in range(len2):
-        array.append(1)
-    # Add blank values to the arrayray as placeholders
+        if mod is not None:
+            # Mod p rows work for row numbers in the billions, so only ask for the positions that are needed.
+            first = int(input("First position? >>>"))
+            last = int(input("Last position? >>>"))
+            array = rowMod(n, mod, first, last+1)
+        elif approx:
+            array = approxRow(n)
+        elif n <= UINT64_MAX_ROW:
+            array = list(map(int, arrayRow(n)))  # Small rows fit in 64 bit numbers and come from a NumPy table.
+        else:
+            array = cache.get(n)
 
-    # print(array)
+        print('')
+        print('')
+        print('-------------------------------------------')
+        print('The values of row ', n, ' arraye bellow.')
+        print(array)
+        print('-------------------------------------------')
+        print('')
+        print('')
 
-    for c in range(n+1):
-        array[c] = combination(n, c)
-    # For each value in the arrayray combign it with the row  number and use the factorial funtion.
-
-    print('')
-    print('')
-    print('-------------------------------------------')
-    print('The values of row ', n, ' arraye bellow.')
-    print(array)
-    print('-------------------------------------------')
-    print('')
-    print('')
-
-    # Driver Code
+        # Driver Code
@@ -0,0 +1,197 @@
+# Sums for summ.py, basic-summ.py, even-summ.py and odd-summ.py.
+# Every sum the scripts ask for is an arithmetic (or geometric) progression given by a start, a step and a count,
+# so it has a closed form that takes the same time for 10 loops as for 10^12 and stays an exact whole number.
+# The old one-term-at-a-time loop is kept as trace(), for when you want to see every term printed (run the
+# scripts with --trace).
+# Series with no closed form (a term typed in by the user) go through chunkedSum(), which works the term out for
+# a whole chunk of indices at once with NumPy and only falls back to a Python loop without it.
+
+import ast
+import math
+from fractions import Fraction
+
+from series_float import floatSum, exactTotal
+
+try:
+    import numpy as np
+except ImportError:  # Without NumPy custom terms are added up one at a time.
+    np = None
+
+CHUNK = 1 << 15  # 32768 indices, a few int64/float64 arrays of this size stay inside the CPU cache.
+INT64_SAFE = 2 ** 62  # Chunk totals below this in size can't overflow int64 while being added up.
+
+
+def arithmeticSum(start, step, count):  # start + (start+step) + ... for count terms.
+    if count <= 0:
+        return 0
+    return count * start + step * (count * (count - 1) // 2)
+
+
+def geometricSum(start, ratio, count):  # start + start*ratio + start*ratio^2 + ... for count terms.
+    if count <= 0:
+        return 0
+    if ratio == 1:
+        return start * count
+    if isinstance(ratio, int) and isinstance(start, int):
+        return start * ((ratio ** count - 1) // (ratio - 1))  # Always divides exactly for whole numbers.
+    return start * (ratio ** count - 1) / (ratio - 1)
+
+
+def exactNumber(text):  # "3" -> 3, "0.5" or "1/2" -> Fraction(1, 2), so typed in steps and ratios stay exact.
+    value = Fraction(text)
+    return value.numerator if value.denominator == 1 else value
+
+
+def arithmeticTerms(start, step, count):
+    return (start + step * j for j in range(max(count, 0)))
+
+
+# The menu types are all arithmetic progressions.
+
+def basicSum(start, stop):  # start + (start+1) + ... + stop, the "Basic" type.
+    return arithmeticSum(start, 1, stop - start + 1)
+
+
+def evenSum(start, loops):  # 2*start + 2*(start+1) + ... for loops terms, the "Even" type.
+    return arithmeticSum(2 * start, 2, loops)
+
+
+def oddSum(start, loops):  # (2*start+1) + (2*start+3) + ... for loops terms, the "Odd" type.
+    return arithmeticSum(2 * start + 1, 2, loops)
+
+
+def basicTerms(start, stop):
+    return arithmeticTerms(start, 1, stop - start + 1)
+
+
+def evenTerms(start, loops):
+    return arithmeticTerms(2 * start, 2, loops)
+
+
+def oddTerms(start, loops):
+    return arithmeticTerms(2 * start + 1, 2, loops)
+
+
+def trace(terms):  # Adds up terms one at a time, printing each one like the scripts always did.
+    out2 = 0
+    for out in terms:
+        print(out)
+        out2 = out2 + out
+    return out2
+
+
+TERM_NAMES = ("sqrt", "sin", "cos", "tan", "log", "exp", "abs", "floor", "pi", "e")
+TERM_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Compare, ast.Call, ast.Name, ast.Constant, ast.Load,
+              ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.USub, ast.UAdd,
+              ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE)
+
+
+def checkTerm(tree):  # Only x, numbers, arithmetic, comparisons and the functions in TERM_NAMES are allowed.
+    for node in ast.walk(tree):
+        if not isinstance(node, TERM_NODES):
+            raise ValueError(type(node).__name__ + " is not allowed in a term")
+        if isinstance(node, ast.Name) and node.id != "x" and node.id not in TERM_NAMES:
+            raise ValueError("Unknown name " + repr(node.id) + " in term")
+        if isinstance(node, ast.Constant) and (isinstance(node.value, bool) or not isinstance(node.value, (int, float))):
+            raise ValueError("Only numbers are allowed as constants in a term")
+        if isinstance(node, ast.Call) and (not isinstance(node.func, ast.Name) or node.func.id not in TERM_NAMES
+                                           or node.keywords):
+            raise ValueError("Only " + ", ".join(TERM_NAMES[:8]) + " can be called in a term")
+
+
+def termFunction(expression):  # Turns a term like "x**2 + 3*x" into a function of x (a number or an array of them).
+    tree = ast.parse(expression, "<term>", "eval")
+    checkTerm(tree)  # Terms come from files and stdin too, so anything but plain arithmetic is refused.
+    code = compile(tree, "<term>", "eval")
+    if np is not None:
+        names = {"sqrt": np.sqrt, "sin": np.sin, "cos": np.cos, "tan": np.tan, "log": np.log, "exp": np.exp,
+                 "abs": np.abs, "floor": np.floor, "pi": np.pi, "e": np.e}
+    else:
+        names = {"sqrt": math.sqrt, "sin": math.sin, "cos": math.cos, "tan": math.tan, "log": math.log,
+                 "exp": math.exp, "abs": abs, "floor": math.floor, "pi": math.pi, "e": math.e}
+    names["__builtins__"] = {}
+
+    def term(x):
+        return eval(code, names, {"x": x})
+    term.expression = expression
+    return term
+
+
+def evaluate(term, x):  # term over an array of indices, on float64 when whole numbers can't be used (x**-1).
+    try:
+        values = np.asarray(term(x))
+    except (ValueError, ZeroDivisionError):
+        x = x.astype(np.float64)
+        values = np.asarray(term(x))
+    if values.shape != x.shape:  # A term that does not use x, like "5".
+        values = np.broadcast_to(values, x.shape)
+    return values
+
+
+def exactChunk(term, lo, hi, mode=None):  # The chunk worked out with Python ints, slow but never overflows.
+    objects = np.arange(lo, hi, dtype=np.int64).astype(object)
+    values = np.asarray(term(objects), dtype=object)
+    if values.shape != objects.shape:
+        values = np.broadcast_to(values, objects.shape)
+    values = values.tolist()
+    if mode is not None and any(isinstance(value, float) for value in values):
+        return exactTotal(values) if mode == "exact" else floatSum(values, mode)
+    return sum(values)
+
+
+def chunkSum(term, lo, hi, mode=None):  # term(lo) + ... + term(hi-1) for one chunk, exact for whole number terms.
+    x = np.arange(lo, hi, dtype=np.int64)
+    with np.errstate(all="ignore"):
+        try:
+            values = evaluate(term, x)
+        except OverflowError:  # A constant too big for int64, like 10**20*x.
+            return exactChunk(term, lo, hi, mode)
+        if values.dtype.kind in "iub":
+            # int64 wraps around silently, in the answer or in any step on the way to it. The same term on float64
+            # can't wrap, so the two only agree (up to float rounding) when nothing overflowed.
+            try:
+                check = np.asarray(evaluate(term, x.astype(np.float64)), dtype=np.float64)
+            except OverflowError:
+                return exactChunk(term, lo, hi)
+            ints = values.astype(np.float64)
+            agree = bool(np.all(np.abs(ints - check) <= np.abs(check) * 1e-9 + 1e-9))
+            biggest = float(np.abs(check).max()) if check.size else 0.0
+            if agree and biggest * len(x) < INT64_SAFE:
+                return int(values.sum(dtype=np.int64))  # Whole chunk added in int64, then moved into a Python int.
+            return exactChunk(term, lo, hi)
+    if mode is None:
+        return float(values.sum())  # NumPy adds floats pairwise, chunks are then combined with math.fsum.
+    if mode == "exact":
+        return exactTotal(values.tolist())  # Kept as a Fraction so the chunks add up exactly too.
+    return floatSum(values.tolist(), mode)
+
+
+def chunkedSum(term, start, stop, chunk=CHUNK, mode=None):  # term(start) + ... + term(stop), a chunk of indices at a time.
+    # mode picks how float terms are added, see series_float.py. None is NumPy's pairwise sum for each chunk
+    # and math.fsum over the chunks.
+    if stop < start:
+        return 0
+    if np is None or start < -INT64_SAFE or stop > INT64_SAFE:  # Indices that don't fit int64 go one at a time.
+        terms = (term(x) for x in range(start, stop + 1))
+        return sum(terms) if mode is None else floatSum(terms, mode)
+    return combine(chunkSums(term, start, stop, chunk, mode), mode)
+
+
+def chunkSums(term, start, stop, chunk=CHUNK, mode=None):  # Yields the sum of every chunk of start..stop, in order.
+    for lo in range(start, stop + 1, chunk):
+        yield chunkSum(term, lo, min(lo + chunk, stop + 1), mode)
+
+
+def combine(partials, mode=None):  # Adds partial sums in order, exactly for whole numbers and Fractions.
+    whole = 0
+    floats = []
+    for part in partials:
+        if isinstance(part, float):
+            floats.append(part)
+        else:
+            whole = whole + part
+    if isinstance(whole, Fraction):  # Exact mode, round once at the very end.
+        return float(whole + exactTotal(floats))
+    if floats:
+        return floatSum(floats, mode or "fsum") + whole
+    return whole
@@ -0,0 +1,99 @@
+# Ways of adding up float terms, from fastest to most exact.
+# Adding floats one at a time (out2 = out2 + out) rounds after every step, and over billions of terms those
+# roundings pile up. The other modes trade some speed for keeping that error down:
+#   naive     plain running total, the way the scripts always added
+#   pairwise  adds neighbouring pairs, then pairs of pairs, so the error grows with log(n) instead of n
+#   kahan     running total plus a second float that keeps the low bits each addition lost
+#   neumaier  Kahan with a fix for when a term is bigger than the running total
+#   fsum      math.fsum, keeps every partial exactly and rounds once at the end
+#   exact     turns every term into a Fraction and adds them exactly (slow, but shows the true answer)
+# See bench_summation.py for how they compare.
+
+import itertools
+import math
+from fractions import Fraction
+
+PAIRWISE_BLOCK = 128  # Blocks this short are added in a plain loop.
+
+
+def naiveSum(values):
+    total = 0.0
+    for value in values:
+        total = total + value
+    return total
+
+
+def kahanSum(values):
+    total = 0.0
+    lost = 0.0  # What rounding took off the total so far (with the opposite sign).
+    for value in values:
+        y = value - lost
+        t = total + y
+        lost = (t - total) - y
+        total = t
+    return total
+
+
+def neumaierSum(values):
+    total = 0.0
+    lost = 0.0
+    for value in values:
+        t = total + value
+        if abs(total) >= abs(value):
+            lost = lost + ((total - t) + value)
+        else:
+            lost = lost + ((value - t) + total)
+        total = t
+    return total + lost
+
+
+def pairwiseSum(values):  # Reads values a block at a time, so any iterator works in constant memory.
+    values = iter(values)
+    stack = []  # (sum, blocks) with blocks halving from bottom to top, like the carries of a binary counter.
+    while True:
+        total = 0.0
+        count = 0
+        for value in itertools.islice(values, PAIRWISE_BLOCK):
+            total = total + value
+            count = count + 1
+        if count == 0:
+            break
+        blocks = 1
+        while stack and stack[-1][1] == blocks:  # Two sums of the same size make one of twice the size.
+            below, _ = stack.pop()
+            total = below + total
+            blocks = blocks * 2
+        stack.append((total, blocks))
+        if count < PAIRWISE_BLOCK:
+            break
+    total = 0.0
+    for part, _ in reversed(stack):
+        total = part + total
+    return total
+
+
+def exactTotal(values):  # The exact total as a Fraction.
+    total = Fraction(0)
+    for value in values:
+        total = total + Fraction(value)
+    return total
+
+
+def exactSum(values):  # The exact total as a float (rounded once).
+    return float(exactTotal(values))
+
+
+SUMS = {
+    "naive": naiveSum,
+    "pairwise": pairwiseSum,
+    "kahan": kahanSum,
+    "neumaier": neumaierSum,
+    "fsum": math.fsum,
+    "exact": exactSum,
+}
+
+
+def floatSum(values, mode="fsum"):
+    if mode not in SUMS:
+        raise ValueError("Unknown sum mode " + repr(mode) + ", use one of " + ", ".join(SUMS))
+    return SUMS[mode](values)
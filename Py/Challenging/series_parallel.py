@@ -0,0 +1,45 @@
+# Adds up a long series with a user typed term on several processes at once.
+# The index range is cut into equal parts (a few per worker so a slow part doesn't hold everything up), each
+# worker adds up the NumPy chunks of its parts, and the chunk sums are combined in index order. Parts line up with
+# the chunk boundaries series.chunkedSum uses, whole numbers are added exactly and floats with math.fsum over the
+# ordered list, so the answer is the same on every run and for any number of workers.
+# The term is passed around as its text because the compiled function can't be sent to another process.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from series import termFunction, chunkSums, combine, CHUNK
+
+PARTS_PER_WORKER = 4
+MIN_PART = 1 << 20  # Parts smaller than this aren't worth sending to another process.
+
+
+def partSums(expression, lo, hi, mode=None):  # Runs in a worker, returns the chunk sums of terms lo..hi.
+    return list(chunkSums(termFunction(expression), lo, hi, mode=mode))
+
+
+def partBounds(start, stop, parts):  # Splits start..stop into [(lo, hi), ...] with hi included.
+    count = stop - start + 1
+    parts = max(1, min(parts, count // MIN_PART))
+    size = -(-count // parts)
+    size = -(-size // CHUNK) * CHUNK  # Whole chunks only, so chunk boundaries don't depend on the worker count.
+    return [(lo, min(lo + size - 1, stop)) for lo in range(start, stop + 1, size)]
+
+
+def parallelSum(expression, start, stop, workers=None, pool=None, mode=None):  # term(start) + ... + term(stop).
+    if stop < start:
+        return 0
+    workers = workers or os.cpu_count() or 1
+    bounds = partBounds(start, stop, workers * PARTS_PER_WORKER)
+    if len(bounds) == 1 or workers == 1:
+        return combine(partSums(expression, start, stop, mode), mode)
+    own = pool is None
+    if own:
+        pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        parts = pool.map(partSums, [expression] * len(bounds), [lo for lo, hi in bounds], [hi for lo, hi in bounds],
+                         [mode] * len(bounds))
+        return combine((value for part in parts for value in part), mode)
+    finally:
+        if own:
+            pool.shutdown()
@@ -0,0 +1,184 @@
+# Lazy series pipelines, the way summ.py builds every menu type.
+# A series is a range of whole numbers followed by steps, for example
+#   Series.range(1, 100).map(power(2)).sum()                 1^2 + 2^2 + ... + 100^2
+#   Series.count(1).map(term).filter(lambda v: v % 3).take(10).sum()
+# Nothing is worked out until the series is summed, reduced or iterated, and iterating only ever holds one term,
+# so a series of 10^12 terms takes no more memory than one of 10 terms.
+# Before summing, sum() looks at what the pipeline is made of. A range mapped through polynomials (Polynomial,
+# linear, power) or one Exponential is an arithmetic, Faulhaber or geometric sum, worked out in closed form from
+# series.py and faulhaber.py without visiting a single term. A range mapped through one typed in term goes to the
+# NumPy chunks of series.chunkedSum. Anything else (filters, plain Python functions) is added one term at a time.
+# plan() says which of these a series will use.
+
+import functools
+import itertools
+import operator
+
+from faulhaber import polynomialSum
+from series import arithmeticSum, geometricSum, chunkedSum, np
+from series_float import floatSum
+from series_parallel import parallelSum
+
+PARALLEL_MIN = 10000000  # Chunked sums with at least this many terms are split across processes.
+
+
+class Polynomial:  # a0 + a1*x + a2*x^2 + ..., coeffs = [a0, a1, a2, ...].
+    def __init__(self, coeffs):
+        coeffs = list(coeffs)
+        while len(coeffs) > 1 and coeffs[-1] == 0:
+            coeffs.pop()
+        self.coeffs = coeffs or [0]
+
+    def __call__(self, x):
+        value = 0
+        for a in reversed(self.coeffs):  # Horner's method.
+            value = value * x + a
+        return value
+
+    def __eq__(self, other):
+        return isinstance(other, Polynomial) and self.coeffs == other.coeffs
+
+    def __repr__(self):
+        return "Polynomial(" + repr(self.coeffs) + ")"
+
+    def degree(self):
+        return len(self.coeffs) - 1
+
+    def compose(self, inner):  # The polynomial x -> self(inner(x)).
+        result = [0]
+        for a in reversed(self.coeffs):
+            result = multiply(result, inner.coeffs)
+            result[0] = result[0] + a
+        return Polynomial(result)
+
+
+def multiply(p, q):  # Coefficient lists multiplied together.
+    result = [0] * (len(p) + len(q) - 1)
+    for i, a in enumerate(p):
+        if a:
+            for j, b in enumerate(q):
+                result[i + j] = result[i + j] + a * b
+    return result
+
+
+class Exponential:  # start * ratio^x.
+    def __init__(self, start, ratio):
+        self.start = start
+        self.ratio = ratio
+
+    def __call__(self, x):
+        return self.start * self.ratio ** x
+
+    def __repr__(self):
+        return "Exponential(" + repr(self.start) + ", " + repr(self.ratio) + ")"
+
+
+def linear(scale, offset=0):  # x -> scale*x + offset.
+    return Polynomial([offset, scale])
+
+
+def power(p):  # x -> x^p.
+    if p < 0:
+        raise ValueError("Power must be 0 or more, got " + str(p))
+    return Polynomial([0] * p + [1])
+
+
+IDENTITY = Polynomial([0, 1])
+
+
+class Series:
+    # lo..hi (hi None for no end) mapped through form, then through the lazy steps in stages.
+    # form is a Polynomial or an Exponential as long as every step so far could be folded into it.
+    def __init__(self, lo, hi=None, form=IDENTITY, stages=()):
+        self.lo = lo
+        self.hi = hi
+        self.form = form
+        self.stages = tuple(stages)
+
+    @classmethod
+    def range(cls, start, stop):  # start, start+1, ..., stop (stop included, like the menu types).
+        return cls(start, stop)
+
+    @classmethod
+    def count(cls, start=0):  # start, start+1, ... with no end, take() one before summing.
+        return cls(start)
+
+    @classmethod
+    def arithmetic(cls, start, step, count):  # start, start+step, ... for count terms.
+        return cls.range(0, count - 1).map(linear(step, start))
+
+    @classmethod
+    def geometric(cls, start, ratio, count):  # start, start*ratio, ... for count terms.
+        return cls.range(0, count - 1).map(Exponential(start, ratio))
+
+    def then(self, *stages):
+        return Series(self.lo, self.hi, self.form, self.stages + stages)
+
+    def map(self, func):
+        if not self.stages:
+            if isinstance(func, Polynomial) and isinstance(self.form, Polynomial):
+                return Series(self.lo, self.hi, func.compose(self.form))
+            if isinstance(func, Exponential) and self.form == IDENTITY:
+                return Series(self.lo, self.hi, func)
+        return self.then(("map", func))
+
+    def filter(self, predicate):
+        return self.then(("filter", predicate))
+
+    def take(self, n):  # Only the first n terms.
+        if not self.stages:
+            hi = self.lo + n - 1
+            return Series(self.lo, hi if self.hi is None else min(self.hi, hi), self.form)
+        return self.then(("take", n))
+
+    def __iter__(self):
+        values = itertools.count(self.lo) if self.hi is None else range(self.lo, self.hi + 1)
+        if self.form != IDENTITY:
+            values = map(self.form, values)
+        for kind, step in self.stages:
+            if kind == "map":
+                values = map(step, values)
+            elif kind == "filter":
+                values = filter(step, values)
+            else:
+                values = itertools.islice(values, step)
+        return iter(values)
+
+    def finite(self):
+        return self.hi is not None or any(kind == "take" for kind, step in self.stages)
+
+    def plan(self):  # How sum() will add this series up.
+        if self.hi is not None and not self.stages:
+            if isinstance(self.form, Exponential):
+                return "geometric"
+            return "arithmetic" if self.form.degree() <= 1 else "polynomial"
+        if (np is not None and self.hi is not None and self.form == IDENTITY and len(self.stages) == 1
+                and self.stages[0][0] == "map" and hasattr(self.stages[0][1], "expression")):
+            return "chunked"  # One term from series.termFunction, worked out a NumPy chunk at a time.
+        return "loop"
+
+    def sum(self, mode=None, workers=1):  # mode picks how float terms are added, see series_float.py.
+        plan = self.plan()
+        lo, hi = self.lo, self.hi
+        if plan == "arithmetic":
+            step = self.form.coeffs[1] if self.form.degree() == 1 else 0
+            return arithmeticSum(self.form(lo), step, hi - lo + 1)
+        if plan == "polynomial":
+            return polynomialSum(self.form.coeffs, lo, hi)
+        if plan == "geometric":
+            return geometricSum(self.form(lo), self.form.ratio, hi - lo + 1)
+        if plan == "chunked":
+            term = self.stages[0][1]
+            if workers > 1 and hi - lo + 1 >= PARALLEL_MIN:
+                return parallelSum(term.expression, lo, hi, workers, mode=mode)
+            return chunkedSum(term, lo, hi, mode=mode)
+        if not self.finite():
+            raise ValueError("Series has no end, take() some terms before adding it up")
+        return sum(self) if mode is None else floatSum(self, mode)
+
+    def reduce(self, func, initial=0):
+        if func is operator.add:
+            return initial + self.sum()
+        if not self.finite():
+            raise ValueError("Series has no end, take() some terms before reducing it")
+        return functools.reduce(func, self, initial)
@@ -1,55 +1,110 @@
 import numpy as np
 import statistics
 import math
+import os
+import sys
+from fractions import Fraction
+from series import termFunction, trace, exactNumber  # Typed in terms, and --trace printing every term
+from series_pipeline import Series, Polynomial, linear, power  # Every menu type is a Series, see series_pipeline.py
+from summ_batch import batchFromArgs  # python summ.py --batch questions.txt answers many at once
 
-run = 1
-
-while run == 1:
-    print('1. Basic')
-    print('2. Even')
-    print('3. Odd')
-
-    type = int(input("Type Of Summ? >>>"))
-
-    if type == 1:
-        i = int(input("Start Value? >>>"))
-        k = int(input("Number Of Loops >>>"))
-        out2 = 0
-
-        for i in range(i, k+1):
-            x = i
-            out = x
-            print(out)
-
-            out2 = out2 + out
-        print('Output =', out2)
-
-    if type == 2:
-        i = int(input("Start Value? >>>"))
-        k = int(input("Number Of Loops >>>"))
-        out2 = 0
-
-        for i in range(k):
-            x = i
-            out = 2 * x
-            print(out)
-
-            out2 = out2 + out
-        print(' ')
-        print('Output =', out2)
-        print(' ')
-
-    if type == 3:
-        i = int(input("Start Value? >>>"))
-        k = int(input("Number Of Loops >>>"))
-        out2 = 0
-
-        for i in range(k):
-            x = i
-            out = (2 * x) + 1
-            print(out)
-
-            out2 = out2 + out
-        print(' ')
-        print('Output =', out2)
-        print(' ')
+if hasattr(sys, "set_int_max_str_digits"):
+    sys.set_int_max_str_digits(0)  # Let print show answers with more than 4300 digits (Powers, Geometric).
+traceMode = "--trace" in sys.argv  # python summ.py --trace prints every term like the old loop did.
+workers = os.cpu_count() or 1  # Long custom series are split across all cores.
+# python summ.py --sum-mode kahan picks how custom float terms are added, see series_float.py for the modes.
+sumMode = sys.argv[sys.argv.index("--sum-mode") + 1] if "--sum-mode" in sys.argv[:-1] else None
+
+if __name__ == "__main__":  # Keeps the worker processes from series_parallel.py from running the menu.
+    if batchFromArgs():
+        sys.exit()
+    run = 1
+
+    while run == 1:
+        print('1. Basic')
+        print('2. Even')
+        print('3. Odd')
+        print('4. Powers')
+        print('5. Polynomial')
+        print('6. Custom')
+        print('7. Arithmetic')
+        print('8. Geometric')
+
+        type = int(input("Type Of Summ? >>>"))
+
+        if type == 1:
+            i = int(input("Start Value? >>>"))
+            k = int(input("Number Of Loops >>>"))
+            series = Series.range(i, k)
+            out2 = trace(series) if traceMode else series.sum()
+            print('Output =', out2)
+
+        if type == 2:
+            i = int(input("Start Value? >>>"))
+            k = int(input("Number Of Loops >>>"))
+            series = Series.range(i, i + k - 1).map(linear(2))
+            out2 = trace(series) if traceMode else series.sum()
+            print(' ')
+            print('Output =', out2)
+            print(' ')
+
+        if type == 3:
+            i = int(input("Start Value? >>>"))
+            k = int(input("Number Of Loops >>>"))
+            series = Series.range(i, i + k - 1).map(linear(2, 1))
+            out2 = trace(series) if traceMode else series.sum()
+            print(' ')
+            print('Output =', out2)
+            print(' ')
+
+        if type == 4:
+            i = int(input("Start Value? >>>"))
+            k = int(input("Number Of Loops >>>"))
+            p = int(input("Power? >>>"))
+            series = Series.range(i, k).map(power(p))
+            out2 = trace(series) if traceMode else series.sum()
+            print(' ')
+            print('Output =', out2)
+            print(' ')
+
+        if type == 5:
+            i = int(input("Start Value? >>>"))
+            k = int(input("Number Of Loops >>>"))
+            # For example 1 0 3 means 1 + 0x + 3x^2, fractions like 1/2 work too.
+            coeffs = [Fraction(a) for a in input("Coefficients (a0 a1 a2 ...)? >>>").split()]
+            series = Series.range(i, k).map(Polynomial(coeffs))
+            out2 = trace(series) if traceMode else series.sum()
+            print(' ')
+            print('Output =', out2)
+            print(' ')
+
+        if type == 6:
+            i = int(input("Start Value? >>>"))
+            k = int(input("Number Of Loops >>>"))
+            # Any term in x, for example x**2 % 7 or 1/x or sqrt(x).
+            term = termFunction(input("Term? >>>"))
+            series = Series.range(i, k).map(term)
+            out2 = trace(series) if traceMode else series.sum(sumMode, workers)
+            print(' ')
+            print('Output =', out2)
+            print(' ')
+
+        if type == 7:
+            i = exactNumber(input("Start Value? >>>"))
+            step = exactNumber(input("Step? >>>"))
+            k = int(input("Number Of Loops >>>"))
+            series = Series.arithmetic(i, step, k)
+            out2 = trace(series) if traceMode else series.sum()
+            print(' ')
+            print('Output =', out2)
+            print(' ')
+
+        if type == 8:
+            i = exactNumber(input("Start Value? >>>"))
+            ratio = exactNumber(input("Ratio? >>>"))
+            k = int(input("Number Of Loops >>>"))
+            series = Series.geometric(i, ratio, k)
+            out2 = trace(series) if traceMode else series.sum()
+            print(' ')
+            print('Output =', out2)
+            print(' ')
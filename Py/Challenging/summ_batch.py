@@ -0,0 +1,177 @@
+# Batch mode for summ.py, basic-summ.py, even-summ.py and odd-summ.py.
+# Instead of answering one typed in question at a time, --batch reads many questions from a file (or stdin with
+# --batch -) and writes one JSON answer per line, so the sums can run inside pipelines. All questions share one
+# process, so the Faulhaber coefficients, compiled terms and repeated answers are only worked out once.
+#
+# Each input line is either JSON, for example
+#   {"type": "powers", "start": 1, "loops": 1000000, "power": 3}
+# or plain words in the order the script asks for them, for example
+#   4 1 1000000 3
+# Scripts with only one type (basic-summ.py and friends) can leave the type out: "1 100" is start 1, loops 100.
+# If they do give it ("2 1 100" to even-summ.py), it has to be the script's own type.
+# Blank lines and lines starting with # are skipped.
+#
+# Types: 1 basic, 2 even, 3 odd, 4 powers (needs power), 5 polynomial (needs coefficients), 6 custom (needs term),
+#        7 arithmetic (needs step), 8 geometric (needs ratio). For 7 and 8 the plain word order is start step loops.
+# Custom questions in JSON can also give a "mode" for adding float terms (see series_float.py).
+
+import json
+import math
+import sys
+from fractions import Fraction
+
+from faulhaber import powerSum, polynomialSum
+from series import basicSum, evenSum, oddSum, termFunction, chunkedSum
+from series import arithmeticSum, geometricSum, exactNumber
+
+TYPES = {"basic": 1, "even": 2, "odd": 3, "powers": 4, "polynomial": 5, "custom": 6, "arithmetic": 7, "geometric": 8}
+NAMES = {number: name for name, number in TYPES.items()}
+
+terms = {}  # Term text -> compiled term, shared by every question in the batch.
+answers = {}  # Question -> answer, so a repeated question is answered straight away.
+
+
+def typeNumber(value):
+    if isinstance(value, str) and value.lower() in TYPES:
+        return TYPES[value.lower()]
+    number = int(value)
+    if number not in NAMES:
+        raise ValueError("Unknown type " + repr(value))
+    return number
+
+
+def wholeNumber(value, name):  # Only real ints or strings like "12" or "-3", int() would quietly turn 1.5 into 1.
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lstrip("-").isdigit() and value.strip().isascii():
+        return int(value)
+    raise ValueError(name + " must be a whole number, got " + repr(value))
+
+
+def parse(line, defaultType=None):  # Turns one input line into a question dict.
+    if line.startswith("{"):
+        question = json.loads(line)
+        if "type" not in question:
+            if defaultType is None:
+                raise ValueError("Question has no type")
+            question["type"] = defaultType
+    else:
+        words = line.split()
+        if defaultType is None:
+            question = {"type": words[0]}
+            words = words[1:]
+        else:
+            question = {"type": defaultType}
+            if len(words) > 2:  # "<type> <start> <loops>", the type has to be the script's own.
+                if typeNumber(words[0]) != typeNumber(defaultType):
+                    raise ValueError("This script only answers " + NAMES[typeNumber(defaultType)] + " questions, got type "
+                                     + repr(words[0]))
+                words = words[1:]
+        kind = typeNumber(question["type"])
+        if kind in (7, 8):
+            if len(words) < 3:
+                raise ValueError("Expected a start value, a " + ("step" if kind == 7 else "ratio") + " and a number of loops")
+            question["start"] = words[0]
+            question["step" if kind == 7 else "ratio"] = words[1]
+            words = [words[0]] + words[2:]
+        if len(words) < 2:
+            raise ValueError("Expected a start value and a number of loops")
+        question["start"], question["loops"] = words[0], words[1]
+        extra = words[2:]
+        if kind in (1, 2, 3) and extra:
+            raise ValueError("Unexpected words after the number of loops: " + " ".join(extra))
+        if kind == 4:
+            question["power"] = extra[0] if extra else None
+        elif kind == 5:
+            question["coefficients"] = extra
+        elif kind == 6:
+            question["term"] = " ".join(extra)
+    question["type"] = typeNumber(question["type"])
+    question["start"] = exactNumber(str(question["start"])) if question["type"] in (7, 8) else wholeNumber(question["start"], "start")
+    question["loops"] = wholeNumber(question["loops"], "loops")
+    if question.get("power") is not None:
+        question["power"] = wholeNumber(question["power"], "power")
+    return question
+
+
+def answer(question):  # Works out one question with the closed forms (or chunked sums for custom terms).
+    kind, i, k = question["type"], question["start"], question["loops"]
+    if kind == 1:
+        return basicSum(i, k)
+    if kind == 2:
+        return evenSum(i, k)
+    if kind == 3:
+        return oddSum(i, k)
+    if kind == 7:
+        if question.get("step") is None:
+            raise ValueError("Arithmetic needs a step")
+        return arithmeticSum(i, exactNumber(str(question["step"])), k)
+    if kind == 8:
+        if question.get("ratio") is None:
+            raise ValueError("Geometric needs a ratio")
+        return geometricSum(i, exactNumber(str(question["ratio"])), k)
+    if kind == 4:
+        if question.get("power") is None:
+            raise ValueError("Powers needs a power")
+        return powerSum(question["power"], i, k)
+    if kind == 5:
+        coeffs = [Fraction(a) for a in question.get("coefficients") or []]
+        return polynomialSum(coeffs, i, k)
+    term = question.get("term")
+    if not term:
+        raise ValueError("Custom needs a term")
+    if term not in terms:
+        terms[term] = termFunction(term)
+    return chunkedSum(terms[term], i, k, mode=question.get("mode"))  # "mode": "kahan" etc, see series_float.py
+
+
+def toJson(value):
+    if isinstance(value, float) and not math.isfinite(value):
+        return str(value)  # JSON has no inf or nan either, so "inf", "-inf" and "nan".
+    if isinstance(value, Fraction):
+        if value.denominator == 1:
+            return value.numerator
+        return str(value)  # JSON has no fractions, so "9/2".
+    if hasattr(value, "item"):  # NumPy numbers.
+        return toJson(value.item())
+    return value
+
+
+def key(question):
+    return json.dumps(question, sort_keys=True, default=str)
+
+
+def runBatch(lines, out, defaultType=None):  # Answers every line of lines, writing JSON lines to out.
+    if hasattr(sys, "set_int_max_str_digits"):
+        sys.set_int_max_str_digits(0)  # Answers can have far more than 4300 digits.
+    count = 0
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            question = parse(line, defaultType)
+            k = key(question)
+            if k not in answers:
+                answers[k] = answer(question)
+            result = dict(question, type=NAMES[question["type"]], start=toJson(question["start"]), output=toJson(answers[k]))
+            text = json.dumps(result, allow_nan=False)
+        except Exception as error:  # One bad question shouldn't stop the rest of the batch.
+            text = json.dumps({"line": number, "error": str(error) or type(error).__name__})
+        out.write(text + "\n")
+        count = count + 1
+    out.flush()
+    return count
+
+
+def batchFromArgs(defaultType=None):  # Runs batch mode if --batch was given on the command line, returns True if it did.
+    if "--batch" not in sys.argv:
+        return False
+    position = sys.argv.index("--batch") + 1
+    source = sys.argv[position] if position < len(sys.argv) and not sys.argv[position].startswith("--") else "-"
+    if source == "-":
+        runBatch(sys.stdin, sys.stdout, defaultType)
+    else:
+        with open(source) as lines:
+            runBatch(lines, sys.stdout, defaultType)
+    return True